@@ -40,6 +40,11 @@ class AppConfig:
     CACHE_TIMEOUT = 300  # 5 minutes
     MAX_RETRIES = 3
     RETRY_DELAY = 5
+    # Shared HTTP connection pool for outbound NASA requests
+    HTTP_POOL_LIMIT = 64
+    HTTP_POOL_LIMIT_PER_HOST = 32
+    HTTP_DNS_CACHE_TTL = 300
+    HTTP_KEEPALIVE_TIMEOUT = 30
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
     ENVIRONMENT = os.getenv('ENVIRONMENT', 'development')
 
@@ -1,7 +1,5 @@
-import numpy as np
-from typing import Dict, List, Tuple
+from typing import Dict, List
 from dataclasses import dataclass
-from datetime import datetime
 
 @dataclass
 class Municipality:
@@ -1,27 +1,42 @@
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Body
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-import asyncio
+from fastapi.responses import Response
+from contextlib import asynccontextmanager
+import numpy as np
+from bisect import bisect_right
 from datetime import datetime, timedelta
 import logging
-from typing import Dict, List, Optional
-import json
+from typing import Dict, List
+from cachetools import TTLCache
+import orjson
 
 from app.config import AppConfig
 from app.nasa_data_service import RealNASADataService
-from app.risk_engine import EnhancedRiskEngine
+from app.risk_engine import EnhancedRiskEngine, RISK_LEVEL_THRESHOLDS, RISK_LEVELS
 from app.geo_data import LuandaGeoData
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Initialize services on startup and release shared resources on shutdown"""
+    logger.info("🚀 SIGA-Angola Unified Dashboard API Starting Up...")
+    logger.info("📊 Monitoring %d municipalities and %d provinces", len(geo_data.municipalities), len(geo_data.provinces))
+    await refresh_all_data()
+    try:
+        yield
+    finally:
+        await RealNASADataService.close_session()
+
 app = FastAPI(
     title="SIGA-Angola Unified NASA Dashboard API",
     description="Unified Risk and Environmental Dashboard for Angola Municipalities and Provinces",
     version="4.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # CORS configuration
@@ -47,12 +62,18 @@ data_cache = {
     "last_updated": None
 }
 
-@app.on_event("startup")
-async def startup_event():
-    """Initialize services on startup"""
-    logger.info("🚀 SIGA-Angola Unified Dashboard API Starting Up...")
-    logger.info(f"📊 Monitoring {len(geo_data.municipalities)} municipalities and {len(geo_data.provinces)} provinces")
-    await refresh_all_data()
+# Risk types shown in the comprehensive and environmental views
+COMPREHENSIVE_RISK_TYPES = ("flood", "fire", "drought", "cyclone", "air_quality", "water_quality", "pollution")
+ENVIRONMENTAL_RISK_TYPES = ("air_quality", "water_quality", "pollution", "population")
+
+# Encoded fallback bodies are reused for a location during an outage burst
+FALLBACK_RESPONSE_TTL = 60
+fallback_response_cache = TTLCache(maxsize=10000, ttl=FALLBACK_RESPONSE_TTL)
+
+# Shared data-source block for fallback responses (all sources report FALLBACK)
+FALLBACK_NASA_SOURCES = dict.fromkeys(
+    ("rainfall", "fires", "air_quality", "water_quality", "population"), "FALLBACK"
+)
 
 @app.get("/")
 async def root():
@@ -112,11 +133,12 @@ async def get_municipality_data(
         # Get NASA data for the location
         nasa_data = await get_nasa_data_for_location(province_upper, municipality_upper)
         
-        # Calculate all risk assessments
-        risk_assessment = await calculate_comprehensive_risk(nasa_data, location_info)
+        # Calculate all risk assessments once and share them between both views
+        all_risks = risk_engine.calculate_all_risks(nasa_data, location_info)
+        risk_assessment = await calculate_comprehensive_risk(nasa_data, location_info, all_risks)
         
         # Calculate environmental data
-        environmental_data = await calculate_environmental_assessment(nasa_data, location_info)
+        environmental_data = await calculate_environmental_assessment(nasa_data, location_info, all_risks)
         
         # Get relevant alerts
         alerts_data = await get_location_alerts(province_upper, municipality_upper, risk_assessment)
@@ -133,8 +155,8 @@ async def get_municipality_data(
         return dashboard
         
     except Exception as e:
-        logger.error(f"Error generating municipality data for {province}/{municipality}: {e}")
-        return await get_fallback_dashboard(province_upper, municipality_upper)
+        logger.error("Error generating municipality data for %s/%s: %s", province, municipality, e)
+        return await build_fallback_response(province_upper, municipality_upper)
 
 @app.get("/api/{province}")
 async def get_province_data(
@@ -160,11 +182,12 @@ async def get_province_data(
         # Get NASA data for the province
         nasa_data = await get_nasa_data_for_location(province_upper, "")
         
-        # Calculate all risk assessments
-        risk_assessment = await calculate_comprehensive_risk(nasa_data, location_info)
+        # Calculate all risk assessments once and share them between both views
+        all_risks = risk_engine.calculate_all_risks(nasa_data, location_info)
+        risk_assessment = await calculate_comprehensive_risk(nasa_data, location_info, all_risks)
         
         # Calculate environmental data
-        environmental_data = await calculate_environmental_assessment(nasa_data, location_info)
+        environmental_data = await calculate_environmental_assessment(nasa_data, location_info, all_risks)
         
         # Get relevant alerts
         alerts_data = await get_location_alerts(province_upper, "", risk_assessment)
@@ -207,8 +230,8 @@ async def get_province_data(
         return dashboard
         
     except Exception as e:
-        logger.error(f"Error generating province data for {province}: {e}")
-        return await get_fallback_dashboard(province_upper, "")
+        logger.error("Error generating province data for %s: %s", province, e)
+        return await build_fallback_response(province_upper, "")
 
 @app.get("/api/municipalities")
 async def get_all_municipalities():
@@ -275,11 +298,12 @@ async def get_unified_dashboard(
         # Get NASA data for the location
         nasa_data = await get_nasa_data_for_location(province, municipality)
         
-        # Calculate all risk assessments
-        risk_assessment = await calculate_comprehensive_risk(nasa_data, location_info)
+        # Calculate all risk assessments once and share them between both views
+        all_risks = risk_engine.calculate_all_risks(nasa_data, location_info)
+        risk_assessment = await calculate_comprehensive_risk(nasa_data, location_info, all_risks)
         
         # Calculate environmental data
-        environmental_data = await calculate_environmental_assessment(nasa_data, location_info)
+        environmental_data = await calculate_environmental_assessment(nasa_data, location_info, all_risks)
         
         # Get relevant alerts
         alerts_data = await get_location_alerts(province, municipality, risk_assessment)
@@ -301,8 +325,33 @@ async def get_unified_dashboard(
         return dashboard
         
     except Exception as e:
-        logger.error(f"Error generating unified dashboard: {e}")
-        return await get_fallback_dashboard(province, municipality)
+        logger.error("Error generating unified dashboard: %s", e)
+        return await build_fallback_response(province, municipality)
+
+@app.post("/api/indicators")
+async def get_bulk_indicators(
+    location_data: Dict = Body(default={}, example={"municipalities": ["VIANA", "CAZENGA"]})
+):
+    """
+    Core NASA indicators for many municipalities in one vectorized call.
+    
+    Request body:
+    - municipalities: List of municipality ids (optional, defaults to all)
+    """
+    requested = [mun.upper() for mun in location_data.get("municipalities", [])]
+    unknown = [mun for mun in requested if mun not in geo_data.municipalities]
+    if unknown:
+        raise HTTPException(status_code=404, detail=f"Municipalities not found: {', '.join(unknown)}")
+    
+    nasa_service = RealNASADataService()
+    indicators = await nasa_service.get_indicators_bulk(requested or list(geo_data.municipalities))
+    
+    return {
+        "indicators": indicators,
+        "risks": score_bulk_risks(indicators),
+        "total_locations": len(indicators),
+        "last_updated": datetime.utcnow().isoformat()
+    }
 
 @app.get("/api/provinces")
 async def get_all_provinces():
@@ -395,21 +444,15 @@ async def get_system_status():
             "timestamp": datetime.utcnow().isoformat()
         }
     except Exception as e:
-        logger.error(f"Error getting system status: {e}")
+        logger.error("Error getting system status: %s", e)
         return {"system": "DEGRADED", "error": str(e)}
 
 # Core Business Logic for Unified Dashboard (UNCHANGED)
-async def calculate_comprehensive_risk(nasa_data: Dict, location_info: Dict) -> Dict:
+async def calculate_comprehensive_risk(nasa_data: Dict, location_info: Dict, all_risks: Dict = None) -> Dict:
     """Calculate comprehensive risk assessment"""
-    risks = {
-        "flood": risk_engine.calculate_flood_risk(nasa_data, location_info),
-        "fire": risk_engine.calculate_fire_risk(nasa_data, location_info),
-        "drought": risk_engine.calculate_drought_risk(nasa_data, location_info),
-        "cyclone": risk_engine.calculate_cyclone_risk(nasa_data, location_info),
-        "air_quality": risk_engine.calculate_air_quality_risk(nasa_data, location_info),
-        "water_quality": risk_engine.calculate_water_quality_risk(nasa_data, location_info),
-        "pollution": risk_engine.calculate_pollution_impact(nasa_data, location_info)
-    }
+    if all_risks is None:
+        all_risks = risk_engine.calculate_all_risks(nasa_data, location_info)
+    risks = {risk_type: all_risks[risk_type] for risk_type in COMPREHENSIVE_RISK_TYPES}
     
     # Calculate overall risk
     risk_scores = [risk['score'] * risk['confidence'] for risk in risks.values()]
@@ -447,14 +490,11 @@ async def calculate_comprehensive_risk(nasa_data: Dict, location_info: Dict) ->
         }
     }
 
-async def calculate_environmental_assessment(nasa_data: Dict, location_info: Dict) -> Dict:
+async def calculate_environmental_assessment(nasa_data: Dict, location_info: Dict, all_risks: Dict = None) -> Dict:
     """Calculate comprehensive environmental assessment"""
-    environmental_risks = {
-        "air_quality": risk_engine.calculate_air_quality_risk(nasa_data, location_info),
-        "water_quality": risk_engine.calculate_water_quality_risk(nasa_data, location_info),
-        "pollution": risk_engine.calculate_pollution_impact(nasa_data, location_info),
-        "population": risk_engine.calculate_population_impact(nasa_data, location_info)
-    }
+    if all_risks is None:
+        all_risks = risk_engine.calculate_all_risks(nasa_data, location_info)
+    environmental_risks = {risk_type: all_risks[risk_type] for risk_type in ENVIRONMENTAL_RISK_TYPES}
     
     # Calculate overall environmental health index
     env_scores = [risk['score'] for risk in environmental_risks.values()]
@@ -468,6 +508,52 @@ async def calculate_environmental_assessment(nasa_data: Dict, location_info: Dic
         "recommendations": generate_environmental_recommendations(environmental_risks)
     }
 
+def score_bulk_risks(indicators: Dict[str, Dict]) -> Dict[str, Dict]:
+    """Score environmental risks for every municipality in a bulk indicator result at once"""
+    if not indicators:
+        return {}
+    mun_ids = list(indicators)
+    rows = list(indicators.values())
+    risk_factors = [geo_data.municipalities[mun_id].risk_factors for mun_id in mun_ids]
+    
+    def column(key):
+        return np.array([row[key] for row in rows], dtype=float)
+    
+    def factor(key, default):
+        return np.array([factors.get(key, default) for factors in risk_factors], dtype=float)
+    
+    density = column("population_density_km2")
+    raw_scores = {
+        "flood": risk_engine.calculate_flood_scores_batch(
+            column("rainfall_24h_mm"), column("forecast_48h_mm"), column("confidence"), factor("flood", 0.5)),
+        "fire": risk_engine.calculate_fire_scores_batch(
+            column("fire_count"), column("fire_risk_score"), factor("fire", 0.5)),
+        # The bulk payload has no MODIS columns, so drought uses the scalar defaults (index 0, NDVI 0.5)
+        "drought": risk_engine.calculate_drought_scores_batch(
+            np.zeros(len(rows)), np.full(len(rows), 0.5), factor("drought", 0.5)),
+        "air_quality": risk_engine.calculate_air_quality_scores_batch(
+            column("air_quality_index"), factor("urban", 0.5)),
+        "water_quality": risk_engine.calculate_water_quality_scores_batch(
+            column("pollution_index"), factor("coastal", 0.3), density),
+        "population": risk_engine.calculate_population_scores_batch(
+            density, column("vulnerability_index"), column("growth_trend"))
+    }
+    
+    # Cap and label every risk type in one pass over the stacked (risk type x location) scores
+    risk_types = list(raw_scores)
+    stacked = np.stack(list(raw_scores.values()))
+    caps = np.array([[98 if risk_type == "flood" else 95] for risk_type in risk_types])
+    capped = np.minimum(caps, stacked.astype(int)).T.tolist()
+    levels = risk_engine.get_risk_levels_batch(stacked).T.tolist()
+    
+    return {
+        mun_id: {
+            risk_type: {"level": level, "score": score}
+            for risk_type, score, level in zip(risk_types, mun_scores, mun_levels)
+        }
+        for mun_id, mun_scores, mun_levels in zip(mun_ids, capped, levels)
+    }
+
 async def get_location_alerts(province: str, municipality: str, risk_assessment: Dict) -> Dict:
     """Get alerts relevant to the specific location"""
     alerts = []
@@ -618,25 +704,41 @@ async def refresh_all_data():
     # Refresh data for all provinces
     provinces_to_refresh = ["LUANDA", "BENGUELA", "HUAMBO", "CABINDA", "HUILA", "CUNENE"]
     
-    refresh_tasks = []
+    targets = []
     
     for province in provinces_to_refresh:
         # Refresh province level data
-        refresh_tasks.append(refresh_location_data(province, ""))
+        targets.append((province, ""))
         
         # Refresh key municipalities in each province
         try:
             municipalities = get_municipalities_by_province(province)
             for municipality in municipalities[:2]:  # Limit to 2 municipalities to avoid overloading
-                refresh_tasks.append(refresh_location_data(province, municipality))
+                targets.append((province, municipality))
         except Exception as e:
-            logger.warning(f"⚠️ Could not get municipalities for {province}: {e}")
+            logger.warning("⚠️ Could not get municipalities for %s: %s", province, e)
     
-    # Execute all refresh tasks with concurrency limit
-    await asyncio.gather(*refresh_tasks, return_exceptions=True)
+    # Fetch every location concurrently through one service
+    try:
+        async with RealNASADataService() as nasa_service:
+            results = await nasa_service.get_all_indicators_for_locations([
+                (municipality, "municipality") if municipality else (province, "province")
+                for province, municipality in targets
+            ])
+    except Exception as e:
+        logger.error("❌ Error refreshing NASA data: %s", e)
+        results = [e] * len(targets)
+    
+    for (province, municipality), location_data in zip(targets, results):
+        if isinstance(location_data, Exception):
+            logger.error("❌ Error refreshing data for %s/%s: %s", province, municipality, location_data)
+            await set_fallback_data(province, municipality)
+        else:
+            cache_key = f"{province}_{municipality}" if municipality else province
+            data_cache["nasa_data"][cache_key] = location_data
     
     data_cache["last_updated"] = datetime.utcnow().isoformat()
-    logger.info(f"✅ Data refresh completed for {len(provinces_to_refresh)} provinces")
+    logger.info("✅ Data refresh completed for %d provinces", len(provinces_to_refresh))
 
 async def refresh_location_data(province: str, municipality: str = ""):
     """Refresh NASA data for specific location with proper error handling"""
@@ -645,61 +747,19 @@ async def refresh_location_data(province: str, municipality: str = ""):
             location_id = municipality if municipality else province
             location_type = "municipality" if municipality else "province"
             
-            # Fetch data concurrently with proper error handling
-            results = await asyncio.gather(
-                nasa_service.get_real_gpm_rainfall(location_id, location_type),
-                nasa_service.get_real_viirs_fires(location_id, location_type),
-                nasa_service.get_real_air_quality(location_id, location_type),
-                nasa_service.get_real_water_quality(location_id, location_type),
-                nasa_service.get_population_density(location_id, location_type),
-                return_exceptions=True
-            )
-            
-            # Process results with safe fallbacks
-            gpm_data, viirs_data, air_quality_data, water_quality_data, population_data = results
-            
-            # Handle each data type with safe fallbacks
-            location_data = {
-                "gpm": await safe_get_data(gpm_data, nasa_service, "gpm", location_id, location_type),
-                "viirs": await safe_get_data(viirs_data, nasa_service, "viirs", location_id, location_type),
-                "air_quality": await safe_get_data(air_quality_data, nasa_service, "air_quality", location_id, location_type),
-                "water_quality": await safe_get_data(water_quality_data, nasa_service, "water_quality", location_id, location_type),
-                "population": await safe_get_data(population_data, nasa_service, "population", location_id, location_type)
-            }
+            # Fetch all sources concurrently; failed sources come back as fallbacks
+            location_data = await nasa_service.get_all_indicators(location_id, location_type)
             
             cache_key = f"{province}_{municipality}" if municipality else province
             data_cache["nasa_data"][cache_key] = location_data
             
-            logger.info(f"✅ Data refreshed for {location_type}: {location_id}")
+            logger.info("✅ Data refreshed for %s: %s", location_type, location_id)
             
     except Exception as e:
-        logger.error(f"❌ Error refreshing data for {province}/{municipality}: {e}")
+        logger.error("❌ Error refreshing data for %s/%s: %s", province, municipality, e)
         # Ensure we at least have fallback data in cache
         await set_fallback_data(province, municipality)
 
-async def safe_get_data(data_result, nasa_service, data_type, location_id, location_type):
-    """Safely get data with fallback handling"""
-    if isinstance(data_result, Exception):
-        logger.warning(f"⚠️ {data_type.upper()} data error for {location_id}: {data_result}")
-        return await get_safe_fallback(nasa_service, data_type, location_id, location_type)
-    return data_result
-
-async def get_safe_fallback(nasa_service, data_type, location_id, location_type):
-    """Get safe fallback data without relying on non-existent methods"""
-    try:
-        # Use basic fallback data instead of calling non-existent methods
-        fallbacks = {
-            "gpm": {"rainfall_24h_mm": 15.0, "is_real_data": False, "data_source": "FALLBACK"},
-            "viirs": {"active_fires": [], "fire_count": 0, "is_real_data": False, "data_source": "FALLBACK"},
-            "air_quality": {"pm25_estimate": 20.0, "is_real_data": False, "data_source": "FALLBACK"},
-            "water_quality": {"pollution_index": 35.0, "is_real_data": False, "data_source": "FALLBACK"},
-            "population": {"population_density_km2": 5000, "is_real_data": False, "data_source": "FALLBACK"}
-        }
-        return fallbacks.get(data_type, {})
-    except Exception as e:
-        logger.error(f"❌ Fallback data error for {data_type}: {e}")
-        return {}
-
 async def set_fallback_data(province: str, municipality: str = ""):
     """Set basic fallback data in cache"""
     cache_key = f"{province}_{municipality}" if municipality else province
@@ -721,9 +781,10 @@ def get_municipalities_by_province(province: str):
 def create_alert(province: str, municipality: str, risk_data: Dict, alert_type: str) -> Dict:
     location_name = municipality if municipality else geo_data.provinces[province]["name"]
     overall_risk = risk_data["overall_risk"]
+    now = datetime.utcnow()
     
     return {
-        "alert_id": f"ALT-{province}-{municipality}-{datetime.utcnow().strftime('%H%M')}",
+        "alert_id": f"ALT-{province}-{municipality}-{now:%H%M}",
         "type": alert_type,
         "severity": overall_risk["level"],
         "location": {
@@ -731,10 +792,10 @@ def create_alert(province: str, municipality: str, risk_data: Dict, alert_type:
             "municipality": municipality,
             "name": location_name
         },
-        "issued_at": datetime.utcnow().isoformat(),
+        "issued_at": now.isoformat(),
         "description": generate_alert_description(alert_type, risk_data),
         "recommended_actions": generate_alert_actions(alert_type, risk_data),
-        "valid_until": (datetime.utcnow() + timedelta(hours=24)).isoformat(),
+        "valid_until": (now + timedelta(hours=24)).isoformat(),
         "confidence": overall_risk["confidence"]
     }
 
@@ -798,38 +859,26 @@ def check_seasonal_alerts(province: str, municipality: str) -> List[Dict]:
 
 # Utility Functions (UNCHANGED)
 def get_risk_level(score):
-    if score >= 80:
-        return "CRITICAL"
-    elif score >= 60:
-        return "HIGH"
-    elif score >= 40:
-        return "MEDIUM"
-    elif score >= 20:
-        return "LOW"
-    else:
-        return "VERY_LOW"
+    return RISK_LEVELS[bisect_right(RISK_LEVEL_THRESHOLDS, score)]
+
+# Safety levels share the risk score thresholds
+_SAFETY_LEVELS = ("HIGH_CAUTION", "ELEVATED_CAUTION", "MODERATE_CAUTION", "SAFE", "VERY_SAFE")
 
 def get_safety_level(score):
-    if score >= 80:
-        return "VERY_SAFE"
-    elif score >= 60:
-        return "SAFE"
-    elif score >= 40:
-        return "MODERATE_CAUTION"
-    elif score >= 20:
-        return "ELEVATED_CAUTION"
-    else:
-        return "HIGH_CAUTION"
+    return _SAFETY_LEVELS[bisect_right(RISK_LEVEL_THRESHOLDS, score)]
 
 def calculate_data_quality(risks):
     real_data_count = sum(1 for risk in risks.values() if risk.get('data_quality') == 'real')
     return round((real_data_count / len(risks)) * 100, 1)
 
+_RAINY_SEASON_MONTHS = frozenset({1, 2, 3, 4})
+_DRY_SEASON_MONTHS = frozenset({5, 6, 7, 8, 9})
+
 def get_current_season():
     month = datetime.utcnow().month
-    if month in [1, 2, 3, 4]:
+    if month in _RAINY_SEASON_MONTHS:
         return "RAINY_SEASON"
-    elif month in [5, 6, 7, 8, 9]:
+    elif month in _DRY_SEASON_MONTHS:
         return "DRY_SEASON"
     else:
         return "TRANSITION_SEASON"
@@ -888,11 +937,12 @@ def is_data_stale():
 # Fallback Methods (UNCHANGED)
 async def get_fallback_dashboard(province: str, municipality: str = ""):
     location_info = get_location_info(province, municipality)
+    now = datetime.utcnow()
     
     return {
         "dashboard": {
             "location": location_info,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": now.isoformat(),
             "data_freshness": "FALLBACK_MODE",
             "overall_safety_score": 50,
             "safety_level": "MODERATE_CAUTION",
@@ -924,13 +974,7 @@ async def get_fallback_dashboard(province: str, municipality: str = ""):
             "critical_alerts": 0,
             "alert_summary": "No alert data available in fallback mode"
         },
-        "nasa_data_sources": {
-            "rainfall": "FALLBACK",
-            "fires": "FALLBACK", 
-            "air_quality": "FALLBACK",
-            "water_quality": "FALLBACK",
-            "population": "FALLBACK"
-        },
+        "nasa_data_sources": FALLBACK_NASA_SOURCES,
         "temporal_context": {
             "current_season": get_current_season(),
             "time_of_day": get_time_of_day(),
@@ -947,11 +991,21 @@ async def get_fallback_dashboard(province: str, municipality: str = ""):
         "summary": {
             "key_findings": ["Fallback mode active - real-time NASA data temporarily unavailable"],
             "priority_level": "LOW_PRIORITY_SYSTEM_RECOVERY",
-            "next_update": (datetime.utcnow() + timedelta(minutes=5)).isoformat(),
-            "report_id": f"FBL-{location_info['id']}-{datetime.utcnow().strftime('%Y%m%d%H%M')}"
+            "next_update": (now + timedelta(minutes=5)).isoformat(),
+            "report_id": f"FBL-{location_info['id']}-{now:%Y%m%d%H%M}"
         }
     }
 
+async def build_fallback_response(province: str, municipality: str = ""):
+    """Return the fallback dashboard as a JSON Response, reusing the encoded body for a location"""
+    cache_key = f"{province}_{municipality}" if municipality else province
+    body = fallback_response_cache.get(cache_key)
+    if body is None:
+        body = orjson.dumps(await get_fallback_dashboard(province, municipality))
+        fallback_response_cache[cache_key] = body
+    # A new Response per request; fallback data must not be kept by clients or proxies
+    return Response(content=body, media_type="application/json", headers={"Cache-Control": "no-store"})
+
 async def get_fallback_nasa_data():
     return {
         "gpm": {"rainfall_24h_mm": 25.0, "is_real_data": False},
@@ -974,10 +1028,14 @@ def generate_health_advisories(environmental_risks):
 def generate_environmental_recommendations(environmental_risks):
     return ["Continue environmental monitoring"]
 
+# Precomputed summaries for the common small alert counts
+_ALERT_SUMMARIES = ("No active alerts",) + tuple(f"{i} active alerts" for i in range(1, 32))
+
 def generate_alert_summary(alerts):
-    if not alerts:
-        return "No active alerts"
-    return f"{len(alerts)} active alerts"
+    count = len(alerts)
+    if count < len(_ALERT_SUMMARIES):
+        return _ALERT_SUMMARIES[count]
+    return f"{count} active alerts"
 
 def get_municipality_characteristics(municipality):
     return {"type": "urban", "infrastructure": "developed"}
@@ -1001,8 +1059,4 @@ def generate_key_findings(risk_assessment, environmental_data, alerts_data):
     return ["System operational", "Monitor risk levels"]
 
 def determine_priority_level(risk_assessment, alerts_data):
-    return "MEDIUM_PRIORITY"
-
-if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000, log_level="info")
\ No newline at end of file
+    return "MEDIUM_PRIORITY"
\ No newline at end of file
@@ -1,12 +1,222 @@
+import copy
+import math
+import numbers
 import numpy as np
-from datetime import datetime, timedelta
+from bisect import bisect_left, bisect_right
+from datetime import datetime
 import logging
+import time
+from cachetools import LRUCache
 
 logger = logging.getLogger(__name__)
 
+def _finite(data, key, default=None):
+    """Read a numeric input, or None if it is missing (with no default), not a number, NaN or infinite"""
+    value = data.get(key, default)
+    if isinstance(value, numbers.Real) and math.isfinite(value):
+        return value
+    return None
+
+# Upper AQI bound of each band but the last (a value equal to a bound stays in the lower band)
+_AQI_BAND_THRESHOLDS = (50, 100, 150)
+
+# Risk type -> (risk_profile factor, default factor, score weight) for the location vulnerability boost
+_LOCATION_VULNERABILITY = {
+    "flood": ("flood", 0.5, 20),
+    "fire": ("fire", 0.5, 20),
+    "drought": ("drought", 0.5, 20),
+    "cyclone": ("coastal", 0.3, 15),
+    "air_quality": ("urban", 0.5, 15),
+    "water_quality": ("coastal", 0.3, 15),
+    "pollution": ("industrial", 0.5, 20)
+}
+
+# nasa_data section -> fields read by the calculate_* methods (each also reads is_real_data)
+_RISK_INPUT_FIELDS = (
+    ("gpm", ("rainfall_24h_mm", "forecast_48h_mm", "confidence")),
+    ("viirs", ("fire_count", "fire_risk_score", "total_brightness")),
+    ("modis", ("vegetation_health", "ndvi", "drought_index")),
+    ("vegetation", ("vegetation_health",)),
+    ("cyclone", ("active_systems",)),
+    ("air_quality", ("air_quality_index", "pm25_estimate", "pm10_estimate", "primary_pollutant", "health_advisory")),
+    ("water_quality", ("pollution_index", "turbidity_index", "chlorophyll_index", "water_surface_temp",
+                       "safe_for_recreation")),
+    ("pollution", ("overall_pollution_index", "industrial_pollution_index", "urban_heat_island_effect",
+                   "light_pollution_index", "particulate_matter", "pollution_hotspots")),
+    ("population", ("population_density_km2", "vulnerability_index", "growth_trend", "population_estimate",
+                    "settlement_type", "urban_footprint_km2"))
+)
+
+# risk_profile factors read for the location vulnerability boost
+_RISK_PROFILE_FACTORS = tuple(sorted({factor for factor, _, _ in _LOCATION_VULNERABILITY.values()}))
+
+# Density tier bounds for the population impact text (a value equal to a bound stays in the lower tier)
+_DENSITY_TIER_THRESHOLDS = (5000, 8000)
+
+# Minimum score for each level above VERY_LOW
+RISK_LEVEL_THRESHOLDS = (20, 40, 60, 80)
+RISK_LEVELS = ("VERY_LOW", "LOW", "MEDIUM", "HIGH", "CRITICAL")
+
+# Risk level for each whole score 0-100; the thresholds are integers, so flooring a score keeps its level
+_RISK_LEVEL_BY_SCORE = tuple(RISK_LEVELS[bisect_right(RISK_LEVEL_THRESHOLDS, score)] for score in range(101))
+
 class EnhancedRiskEngine:
+    __slots__ = ("historical_data", "_latest_drought_year", "_risk_cache")
+
+    # Seasonal score boosts by month (index 0 unused)
+    # Fire: +20 in the August-November peak, +10 in July and December
+    _FIRE_SEASON_BOOST = (0, 0, 0, 0, 0, 0, 0, 10, 20, 20, 20, 20, 10)
+    # Drought: +15 through the May-September dry season
+    _DROUGHT_SEASON_BOOST = (0, 0, 0, 0, 0, 15, 15, 15, 15, 15, 0, 0, 0)
+    # Air quality: +15 for dry-season dust, June-September
+    _AIR_QUALITY_SEASON_IMPACT = (0, 0, 0, 0, 0, 0, 15, 15, 15, 15, 0, 0, 0)
+    # Water quality: +12 for rainy-season runoff, January-April
+    _WATER_QUALITY_SEASON_IMPACT = (0, 12, 12, 12, 12, 0, 0, 0, 0, 0, 0, 0, 0)
+
+    # (monotonic time, year, month) of the last clock read, see _today
+    _today_cache = None
+
+    # Bucket labels for bisect_left over strict '>' thresholds (a value equal to a bound stays in the lower bucket)
+    _DROUGHT_CATEGORY_THRESHOLDS = (35, 55, 75)
+    _DROUGHT_CATEGORIES = ("S0_No_Drought", "S1_Mild_Drought", "S2_Moderate_Drought", "S3_Severe_Drought")
+    _WATER_HEALTH_THRESHOLDS = (30, 50, 70)
+    _WATER_HEALTH_IMPLICATIONS = (
+        "Minimal health risk",
+        "Low risk, basic treatment recommended",
+        "Moderate health risk, avoid ingestion",
+        "High risk of waterborne diseases"
+    )
+
+    # Per-AQI-band payloads, indexed by _get_aqi_band
+    _AQI_HEALTH_IMPACTS = (
+        "Minimal health impact",
+        "Moderate health concern",
+        "Unhealthy for sensitive groups",
+        "Serious health effects"
+    )
+    _AQI_VULNERABLE_GROUPS = (
+        ("None specific",),
+        ("Children", "Elderly", "Respiratory conditions"),
+        ("Children", "Elderly", "Respiratory conditions", "Heart conditions"),
+        ("Children", "Elderly", "Respiratory conditions", "Heart conditions")
+    )
+
+    # Fixed area lists by municipality id, shared between responses (serialised as JSON arrays)
+    _IMPACT_AREAS = {
+        "VIANA": ("Industrial Zone", "Transport Corridors"),
+        "INGOMBOTA": ("City Center", "Commercial Areas"),
+        "MUSSULO": ("Coastal Areas", "Fishing Zones")
+    }
+    _IMPACT_AREAS_DEFAULT = ("Urban Area", "Residential Zones")
+    _WATER_IMPACT_AREAS = {
+        "MUSSULO": ("Coastal Waters", "Fishing Areas"),
+        "INGOMBOTA": ("Urban Rivers", "Drainage Systems"),
+        "VIANA": ("Industrial Canals", "Wastewater Outflows")
+    }
+    _WATER_IMPACT_AREAS_DEFAULT = ("Water Bodies", "Drainage Systems")
+
+    # Population impact text by density tier (see _DENSITY_TIER_THRESHOLDS)
+    _CHALLENGES_VERY_DENSE = ("Overcrowding", "Sanitation issues", "Traffic congestion")
+    _CHALLENGES_DENSE = ("Housing pressure", "Service delivery strain")
+    _CHALLENGES_MUNICIPAL = ("Urban planning needs", "Infrastructure maintenance")
+    _PLANNING_RECS_VERY_DENSE = ("Upgrade public transport", "Improve green spaces")
+    _PLANNING_RECS_VULNERABLE = ("Target social housing", "Enhance emergency services")
+    _PLANNING_RECS_DENSE = ("Mixed-use development", "Infrastructure investment")
+    _PLANNING_RECS_DEFAULT = ("Maintain current planning strategies",)
+    # Urban challenges indexed by [density tier][is municipality]
+    _URBAN_CHALLENGES = (
+        ((), _CHALLENGES_MUNICIPAL),
+        (_CHALLENGES_DENSE, _CHALLENGES_DENSE + _CHALLENGES_MUNICIPAL),
+        (_CHALLENGES_VERY_DENSE + _CHALLENGES_DENSE,
+         _CHALLENGES_VERY_DENSE + _CHALLENGES_DENSE + _CHALLENGES_MUNICIPAL)
+    )
+    # Planning recommendations indexed by [density tier][vulnerability > 70]
+    _PLANNING_RECOMMENDATIONS = (
+        (_PLANNING_RECS_DEFAULT, _PLANNING_RECS_VULNERABLE),
+        (_PLANNING_RECS_DENSE, _PLANNING_RECS_VULNERABLE + _PLANNING_RECS_DENSE),
+        (_PLANNING_RECS_VERY_DENSE + _PLANNING_RECS_DENSE,
+         _PLANNING_RECS_VERY_DENSE + _PLANNING_RECS_VULNERABLE + _PLANNING_RECS_DENSE)
+    )
+
+    # Static fallback payloads, copied by the _get_*_fallback methods
+    _FALLBACK_FLOOD = {
+        "level": "LOW",
+        "score": 20,
+        "confidence": 0.5,
+        "factors": {"fallback": True},
+        "prediction_horizon_hours": 24,
+        "flood_type": "unknown",
+        "expected_impact_areas": ("General Area",),
+        "data_quality": "fallback"
+    }
+    _FALLBACK_FIRE = {
+        "level": "LOW",
+        "score": 15,
+        "confidence": 0.5,
+        "details": {"fallback": True},
+        "data_quality": "fallback"
+    }
+    _FALLBACK_DROUGHT = {
+        "level": "LOW",
+        "score": 25,
+        "confidence": 0.5,
+        "indices": {"fallback": True},
+        "drought_category": "S0_No_Drought",
+        "data_quality": "fallback"
+    }
+    _FALLBACK_CYCLONE = {
+        "level": "LOW",
+        "score": 10,
+        "confidence": 0.5,
+        "details": {"fallback": True},
+        "data_quality": "fallback"
+    }
+    _FALLBACK_AIR_QUALITY = {
+        "level": "MEDIUM",
+        "score": 45,
+        "confidence": 0.5,
+        "metrics": {"fallback": True},
+        "health_advisory": "Moderate - Sensitive groups should take care",
+        "vulnerable_groups": ("Children", "Elderly"),
+        "data_quality": "fallback"
+    }
+    _FALLBACK_WATER_QUALITY = {
+        "level": "LOW",
+        "score": 35,
+        "confidence": 0.5,
+        "metrics": {"fallback": True},
+        "impact_areas": ("General Water Bodies",),
+        "health_implications": "Low risk, basic treatment recommended",
+        "data_quality": "fallback"
+    }
+    _FALLBACK_POLLUTION = {
+        "level": "MEDIUM",
+        "score": 50,
+        "confidence": 0.5,
+        "metrics": {"fallback": True},
+        "pollution_hotspots": ("General Area",),
+        "environmental_justice_index": 60,
+        "data_quality": "fallback"
+    }
+    _FALLBACK_POPULATION = {
+        "level": "MEDIUM",
+        "score": 55,
+        "confidence": 0.5,
+        "metrics": {"fallback": True},
+        "urban_challenges": ("General urban pressures",),
+        "planning_recommendations": ("Infrastructure monitoring",),
+        "data_quality": "fallback"
+    }
+
+    # Array forms of the level table for batch scoring
+    _RISK_LEVEL_THRESHOLDS = np.array(RISK_LEVEL_THRESHOLDS)
+    _RISK_LEVEL_LABELS = np.array(RISK_LEVELS)
+
     def __init__(self):
         self.historical_data = self._initialize_historical_data()
+        self._latest_drought_year = max((d['year'] for d in self.historical_data['drought_periods']), default=None)
+        # calculate_all_risks results keyed by the scored input values and month
+        self._risk_cache = LRUCache(maxsize=1024)
     
     def _initialize_historical_data(self):
         """Initialize with Luanda's actual historical environmental data"""
@@ -23,6 +233,8 @@ class EnhancedRiskEngine:
             "water_quality_events": [
                 {"date": "2023-04-10", "turbidity": 0.8, "impact": "high", "zone": "LUANDA_ILHA"}
             ],
+            # No sourced drought records for the covered provinces yet
+            "drought_periods": [],
             "population_trends": [
                 {"year": 2023, "growth_rate": 3.5, "density_increase": 4.2}
             ]
@@ -30,441 +242,515 @@ class EnhancedRiskEngine:
     
     def calculate_flood_risk(self, nasa_data, location_info):
         """Calculate flood risk using real NASA data"""
-        try:
-            rainfall_data = nasa_data['gpm']
-            rainfall_24h = rainfall_data['rainfall_24h_mm']
-            forecast_48h = rainfall_data.get('forecast_48h_mm', 0)
-            confidence = rainfall_data.get('confidence', 0.7)
-            
-            # Base risk from current rainfall
-            if rainfall_24h > 100:
-                base_score = 80 + min(20, (rainfall_24h - 100) / 5)
-            elif rainfall_24h > 50:
-                base_score = 55 + min(25, (rainfall_24h - 50) / 2)
-            elif rainfall_24h > 25:
-                base_score = 35 + min(20, rainfall_24h - 25)
-            else:
-                base_score = max(10, rainfall_24h / 2)
-            
-            # Forecast adjustment
-            forecast_boost = min(25, forecast_48h / 4)
-            
-            # Location vulnerability adjustment
-            location_boost = self._get_location_vulnerability(location_info, "flood")
-            
-            # Data confidence adjustment
-            confidence_adjustment = confidence * 10
-            
-            total_score = base_score + forecast_boost + location_boost + confidence_adjustment
-            
-            risk_level = self._get_risk_level(total_score)
-            
-            return {
-                "level": risk_level,
-                "score": min(98, int(total_score)),
-                "confidence": confidence,
-                "factors": {
-                    "current_rainfall": rainfall_24h,
-                    "forecast_rainfall": forecast_48h,
-                    "location_vulnerability": location_boost,
-                    "data_confidence": confidence_adjustment
-                },
-                "prediction_horizon_hours": 48,
-                "flood_type": self._get_flood_type(rainfall_24h, location_info),
-                "expected_impact_areas": self._get_impact_areas(location_info, total_score),
-                "data_quality": "real" if nasa_data['gpm'].get('is_real_data', False) else "simulated"
-            }
-            
-        except Exception as e:
-            logger.error(f"Flood risk calculation error: {e}")
+        rainfall_data = nasa_data.get('gpm', {})
+        rainfall_24h = _finite(rainfall_data, 'rainfall_24h_mm')
+        forecast_48h = _finite(rainfall_data, 'forecast_48h_mm', 0)
+        confidence = _finite(rainfall_data, 'confidence', 0.7)
+        if None in (rainfall_24h, forecast_48h, confidence):
             return self._get_flood_fallback(location_info)
+        
+        # Base risk from current rainfall (light rain is the common case, so it is tested first)
+        if rainfall_24h <= 25:
+            base_score = max(10, rainfall_24h / 2)
+        elif rainfall_24h <= 50:
+            base_score = 35 + min(20, rainfall_24h - 25)
+        elif rainfall_24h <= 100:
+            base_score = 55 + min(25, (rainfall_24h - 50) / 2)
+        else:
+            base_score = 80 + min(20, (rainfall_24h - 100) / 5)
+        
+        # Forecast adjustment
+        forecast_boost = min(25, forecast_48h / 4)
+        
+        # Location vulnerability adjustment
+        location_boost = self._get_location_vulnerability(location_info, "flood")
+        
+        # Data confidence adjustment
+        confidence_adjustment = confidence * 10
+        
+        total_score = base_score + forecast_boost + location_boost + confidence_adjustment
+        
+        risk_level = self._get_risk_level(total_score)
+        
+        return {
+            "level": risk_level,
+            "score": min(98, int(total_score)),
+            "confidence": confidence,
+            "factors": {
+                "current_rainfall": rainfall_24h,
+                "forecast_rainfall": forecast_48h,
+                "location_vulnerability": location_boost,
+                "data_confidence": confidence_adjustment
+            },
+            "prediction_horizon_hours": 48,
+            "flood_type": self._get_flood_type(rainfall_24h, location_info),
+            "expected_impact_areas": self._get_impact_areas(location_info),
+            "data_quality": self._dq(rainfall_data)
+        }
     
     def calculate_fire_risk(self, nasa_data, location_info):
         """Calculate fire risk using real VIIRS data"""
-        try:
-            fire_data = nasa_data['viirs']
-            vegetation_data = nasa_data.get('modis', {})
-            
-            fire_count = fire_data['fire_count']
-            fire_risk_score = fire_data.get('fire_risk_score', 0)
-            vegetation_health = vegetation_data.get('vegetation_health', 'moderate')
-            ndvi = vegetation_data.get('ndvi', 0.5)
-            
-            # Base score from active fires
-            if fire_count > 0:
-                base_score = 85 + min(15, fire_count * 3)
-                confidence = 0.95
-            else:
-                base_score = fire_risk_score
-                confidence = 0.75
-            
-            # Vegetation dryness adjustment
-            if vegetation_health == "poor":
-                base_score += 20
-            elif vegetation_health == "critical":
-                base_score += 30
-            
-            # NDVI-based adjustment
-            if ndvi < 0.3:
-                base_score += 25
-            elif ndvi < 0.4:
-                base_score += 15
-            elif ndvi < 0.5:
-                base_score += 5
-            
-            # Seasonal adjustment
-            seasonal_boost = self._get_seasonal_fire_boost()
-            base_score += seasonal_boost
-            
-            # Location-specific risk
-            location_boost = self._get_location_vulnerability(location_info, "fire")
-            base_score += location_boost
-            
-            risk_level = self._get_risk_level(base_score)
-            
-            return {
-                "level": risk_level,
-                "score": min(95, int(base_score)),
-                "confidence": confidence,
-                "details": {
-                    "active_fires": fire_count,
-                    "fire_intensity": fire_data.get('total_brightness', 0),
-                    "vegetation_condition": vegetation_health,
-                    "seasonal_risk": seasonal_boost,
-                    "location_risk": location_boost
-                },
-                "data_quality": "real" if nasa_data['viirs'].get('is_real_data', False) else "simulated"
-            }
-            
-        except Exception as e:
-            logger.error(f"Fire risk calculation error: {e}")
+        fire_data = nasa_data.get('viirs', {})
+        vegetation_data = nasa_data.get('modis', {})
+        
+        fire_count = _finite(fire_data, 'fire_count')
+        fire_risk_score = _finite(fire_data, 'fire_risk_score', 0)
+        ndvi = _finite(vegetation_data, 'ndvi', 0.5)
+        if None in (fire_count, fire_risk_score, ndvi):
             return self._get_fire_fallback(location_info)
+        vegetation_health = vegetation_data.get('vegetation_health', 'moderate')
+        
+        # Base score from active fires
+        if fire_count > 0:
+            base_score = 85 + min(15, fire_count * 3)
+            confidence = 0.95
+        else:
+            base_score = fire_risk_score
+            confidence = 0.75
+        
+        # Vegetation dryness adjustment
+        if vegetation_health == "poor":
+            base_score += 20
+        elif vegetation_health == "critical":
+            base_score += 30
+        
+        # NDVI-based adjustment
+        if ndvi < 0.3:
+            base_score += 25
+        elif ndvi < 0.4:
+            base_score += 15
+        elif ndvi < 0.5:
+            base_score += 5
+        
+        # Seasonal adjustment
+        seasonal_boost = self._get_seasonal_fire_boost()
+        base_score += seasonal_boost
+        
+        # Location-specific risk
+        location_boost = self._get_location_vulnerability(location_info, "fire")
+        base_score += location_boost
+        
+        risk_level = self._get_risk_level(base_score)
+        
+        return {
+            "level": risk_level,
+            "score": min(95, int(base_score)),
+            "confidence": confidence,
+            "details": {
+                "active_fires": fire_count,
+                "fire_intensity": fire_data.get('total_brightness', 0),
+                "vegetation_condition": vegetation_health,
+                "seasonal_risk": seasonal_boost,
+                "location_risk": location_boost
+            },
+            "data_quality": self._dq(fire_data)
+        }
     
     def calculate_drought_risk(self, nasa_data, location_info):
         """Calculate drought risk using real MODIS data"""
-        try:
-            modis_data = nasa_data.get('modis', {})
-            vegetation_data = nasa_data.get('vegetation', {})
-            
-            ndvi = modis_data.get('ndvi', 0.5)
-            drought_index = modis_data.get('drought_index', 0)
-            vegetation_health = vegetation_data.get('vegetation_health', 'moderate')
-            
-            # Composite drought score
-            base_score = drought_index
-            
-            # NDVI-based adjustment
-            if ndvi < 0.3:
-                base_score += 30
-            elif ndvi < 0.4:
-                base_score += 20
-            elif ndvi < 0.5:
-                base_score += 10
-            
-            # Vegetation health adjustment
-            if vegetation_health == "poor":
-                base_score += 15
-            elif vegetation_health == "critical":
-                base_score += 25
-            
-            # Historical drought context
-            historical_boost = self._get_historical_drought_context()
-            base_score += historical_boost
-            
-            # Seasonal patterns
-            seasonal_boost = self._get_seasonal_drought_boost()
-            base_score += seasonal_boost
-            
-            # Location adjustment
-            location_boost = self._get_location_vulnerability(location_info, "drought")
-            base_score += location_boost
-            
-            risk_level = self._get_risk_level(base_score)
-            
-            return {
-                "level": risk_level,
-                "score": min(95, int(base_score)),
-                "confidence": 0.80,
-                "indices": {
-                    "ndvi": ndvi,
-                    "drought_index": drought_index,
-                    "vegetation_health": vegetation_health,
-                    "composite_score": base_score
-                },
-                "drought_category": self._get_drought_category(base_score),
-                "data_quality": "real" if nasa_data.get('modis', {}).get('is_real_data', False) else "simulated"
-            }
-            
-        except Exception as e:
-            logger.error(f"Drought risk calculation error: {e}")
+        modis_data = nasa_data.get('modis', {})
+        vegetation_data = nasa_data.get('vegetation', {})
+        
+        ndvi = _finite(modis_data, 'ndvi', 0.5)
+        drought_index = _finite(modis_data, 'drought_index', 0)
+        if None in (ndvi, drought_index):
             return self._get_drought_fallback(location_info)
+        vegetation_health = vegetation_data.get('vegetation_health', 'moderate')
+        
+        # Composite drought score
+        base_score = drought_index
+        
+        # NDVI-based adjustment
+        if ndvi < 0.3:
+            base_score += 30
+        elif ndvi < 0.4:
+            base_score += 20
+        elif ndvi < 0.5:
+            base_score += 10
+        
+        # Vegetation health adjustment
+        if vegetation_health == "poor":
+            base_score += 15
+        elif vegetation_health == "critical":
+            base_score += 25
+        
+        # Historical drought context
+        historical_boost = self._get_historical_drought_context()
+        base_score += historical_boost
+        
+        # Seasonal patterns
+        seasonal_boost = self._get_seasonal_drought_boost()
+        base_score += seasonal_boost
+        
+        # Location adjustment
+        location_boost = self._get_location_vulnerability(location_info, "drought")
+        base_score += location_boost
+        
+        risk_level = self._get_risk_level(base_score)
+        
+        return {
+            "level": risk_level,
+            "score": min(95, int(base_score)),
+            "confidence": 0.80,
+            "indices": {
+                "ndvi": ndvi,
+                "drought_index": drought_index,
+                "vegetation_health": vegetation_health,
+                "composite_score": base_score
+            },
+            "drought_category": self._get_drought_category(base_score),
+            "data_quality": self._dq(modis_data)
+        }
     
     def calculate_cyclone_risk(self, nasa_data, location_info):
         """Calculate cyclone risk using real tracking data"""
-        try:
-            cyclone_data = nasa_data.get('cyclone', {})
-            active_systems = cyclone_data.get('active_systems', 0)
-            
-            if active_systems == 0:
-                return {
-                    "level": "LOW",
-                    "score": 10,
-                    "confidence": 0.90,
-                    "details": {"reason": "no_active_systems"},
-                    "data_quality": "real" if nasa_data.get('cyclone', {}).get('is_real_data', False) else "simulated"
-                }
-            
-            # For Angola, cyclone risk is generally low but we calculate based on proximity
-            location_boost = self._get_location_vulnerability(location_info, "cyclone")
-            base_score = 20 + location_boost
-            
+        cyclone_data = nasa_data.get('cyclone', {})
+        active_systems = _finite(cyclone_data, 'active_systems', 0)
+        if active_systems is None:
+            return self._get_cyclone_fallback(location_info)
+        
+        if active_systems == 0:
             return {
-                "level": self._get_risk_level(base_score),
-                "score": min(95, int(base_score)),
-                "confidence": 0.65,
-                "details": {
-                    "active_systems": active_systems,
-                    "location_vulnerability": location_boost
-                },
-                "data_quality": "real" if nasa_data.get('cyclone', {}).get('is_real_data', False) else "simulated"
+                "level": "LOW",
+                "score": 10,
+                "confidence": 0.90,
+                "details": {"reason": "no_active_systems"},
+                "data_quality": self._dq(cyclone_data)
             }
-            
-        except Exception as e:
-            logger.error(f"Cyclone risk calculation error: {e}")
-            return self._get_cyclone_fallback(location_info)
+        
+        # For Angola, cyclone risk is generally low but we calculate based on proximity
+        location_boost = self._get_location_vulnerability(location_info, "cyclone")
+        base_score = 20 + location_boost
+        
+        return {
+            "level": self._get_risk_level(base_score),
+            "score": min(95, int(base_score)),
+            "confidence": 0.65,
+            "details": {
+                "active_systems": active_systems,
+                "location_vulnerability": location_boost
+            },
+            "data_quality": self._dq(cyclone_data)
+        }
     
     def calculate_air_quality_risk(self, nasa_data, location_info):
         """Calculate health risk from air quality using NASA aerosol data"""
-        try:
-            air_quality = nasa_data.get('air_quality', {})
-            aqi = air_quality.get('air_quality_index', 0)
-            
-            # AQI-based risk scoring
-            if aqi > 150:
-                base_score = 80 + min(20, (aqi - 150) / 5)
-            elif aqi > 100:
-                base_score = 65 + min(15, (aqi - 100) / 4)
-            elif aqi > 50:
-                base_score = 40 + min(25, (aqi - 50) / 2)
-            else:
-                base_score = max(10, aqi / 5)
-            
-            # Location-specific adjustments
-            location_boost = self._get_location_vulnerability(location_info, "air_quality")
-            base_score += location_boost
-            
-            # Seasonal adjustment
-            seasonal_boost = self._get_seasonal_air_quality_impact()
-            base_score += seasonal_boost
-            
-            risk_level = self._get_risk_level(base_score)
-            
-            return {
-                "level": risk_level,
-                "score": min(95, int(base_score)),
-                "confidence": 0.85,
-                "metrics": {
-                    "aqi": aqi,
-                    "pm25": air_quality.get('pm25_estimate', 0),
-                    "pm10": air_quality.get('pm10_estimate', 0),
-                    "primary_pollutant": air_quality.get('primary_pollutant', 'Unknown'),
-                    "health_impact": self._get_health_impact_level(aqi)
-                },
-                "health_advisory": air_quality.get('health_advisory', 'No advisory'),
-                "vulnerable_groups": self._get_vulnerable_groups(aqi),
-                "data_quality": "real" if nasa_data.get('air_quality', {}).get('is_real_data', False) else "simulated"
-            }
-        except Exception as e:
-            logger.error(f"Air quality risk error: {e}")
+        air_quality = nasa_data.get('air_quality', {})
+        aqi = _finite(air_quality, 'air_quality_index', 0)
+        if aqi is None:
             return self._get_air_quality_fallback(location_info)
+        
+        # AQI-based risk scoring, most common bands first
+        if aqi <= 50:
+            base_score = max(10, aqi / 5)
+        elif aqi <= 100:
+            base_score = 40 + min(25, (aqi - 50) / 2)
+        elif aqi <= 150:
+            base_score = 65 + min(15, (aqi - 100) / 4)
+        else:
+            base_score = 80 + min(20, (aqi - 150) / 5)
+        
+        # Classify the AQI band once for the per-band lookups below
+        aqi_band = self._get_aqi_band(aqi)
+        
+        # Location-specific adjustments
+        location_boost = self._get_location_vulnerability(location_info, "air_quality")
+        base_score += location_boost
+        
+        # Seasonal adjustment
+        seasonal_boost = self._get_seasonal_air_quality_impact()
+        base_score += seasonal_boost
+        
+        risk_level = self._get_risk_level(base_score)
+        
+        return {
+            "level": risk_level,
+            "score": min(95, int(base_score)),
+            "confidence": 0.85,
+            "metrics": {
+                "aqi": aqi,
+                "pm25": air_quality.get('pm25_estimate', 0),
+                "pm10": air_quality.get('pm10_estimate', 0),
+                "primary_pollutant": air_quality.get('primary_pollutant', 'Unknown'),
+                "health_impact": self._AQI_HEALTH_IMPACTS[aqi_band]
+            },
+            "health_advisory": air_quality.get('health_advisory', 'No advisory'),
+            "vulnerable_groups": self._AQI_VULNERABLE_GROUPS[aqi_band],
+            "data_quality": self._dq(air_quality)
+        }
     
     def calculate_water_quality_risk(self, nasa_data, location_info):
         """Calculate risk from water quality degradation"""
-        try:
-            water_quality = nasa_data.get('water_quality', {})
-            pollution_index = water_quality.get('pollution_index', 0)
-            
-            base_score = pollution_index
-            
-            # Location vulnerability adjustment
-            location_boost = self._get_location_vulnerability(location_info, "water_quality")
-            base_score += location_boost
-            
-            # Seasonal adjustments
-            seasonal_boost = self._get_seasonal_water_quality_impact()
-            base_score += seasonal_boost
-            
-            # Population impact
-            pop_density = nasa_data.get('population', {}).get('population_density_km2', 0)
-            density_impact = min(15, pop_density / 1000)
-            base_score += density_impact
-            
-            risk_level = self._get_risk_level(base_score)
-            
-            return {
-                "level": risk_level,
-                "score": min(95, int(base_score)),
-                "confidence": 0.80,
-                "metrics": {
-                    "turbidity": water_quality.get('turbidity_index', 0),
-                    "chlorophyll": water_quality.get('chlorophyll_index', 0),
-                    "water_temperature": water_quality.get('water_surface_temp', 0),
-                    "pollution_index": pollution_index,
-                    "recreation_safety": water_quality.get('safe_for_recreation', True)
-                },
-                "impact_areas": self._get_water_impact_areas(location_info),
-                "health_implications": self._get_water_health_implications(pollution_index),
-                "data_quality": "real" if nasa_data.get('water_quality', {}).get('is_real_data', False) else "simulated"
-            }
-        except Exception as e:
-            logger.error(f"Water quality risk error: {e}")
+        water_quality = nasa_data.get('water_quality', {})
+        pollution_index = _finite(water_quality, 'pollution_index', 0)
+        pop_density = _finite(nasa_data.get('population', {}), 'population_density_km2', 0)
+        if None in (pollution_index, pop_density):
             return self._get_water_quality_fallback(location_info)
+        
+        base_score = pollution_index
+        
+        # Location vulnerability adjustment
+        location_boost = self._get_location_vulnerability(location_info, "water_quality")
+        base_score += location_boost
+        
+        # Seasonal adjustments
+        seasonal_boost = self._get_seasonal_water_quality_impact()
+        base_score += seasonal_boost
+        
+        # Population impact
+        density_impact = min(15, pop_density / 1000)
+        base_score += density_impact
+        
+        risk_level = self._get_risk_level(base_score)
+        
+        return {
+            "level": risk_level,
+            "score": min(95, int(base_score)),
+            "confidence": 0.80,
+            "metrics": {
+                "turbidity": water_quality.get('turbidity_index', 0),
+                "chlorophyll": water_quality.get('chlorophyll_index', 0),
+                "water_temperature": water_quality.get('water_surface_temp', 0),
+                "pollution_index": pollution_index,
+                "recreation_safety": water_quality.get('safe_for_recreation', True)
+            },
+            "impact_areas": self._get_water_impact_areas(location_info),
+            "health_implications": self._get_water_health_implications(pollution_index),
+            "data_quality": self._dq(water_quality)
+        }
     
     def calculate_pollution_impact(self, nasa_data, location_info):
         """Calculate overall pollution impact on urban health"""
-        try:
-            pollution_data = nasa_data.get('pollution', {})
-            overall_pollution = pollution_data.get('overall_pollution_index', 0)
-            
-            base_score = overall_pollution
-            
-            # Location-specific pollution sources
-            location_boost = self._get_location_vulnerability(location_info, "pollution")
-            base_score += location_boost
-            
-            # Population density multiplier
-            pop_density = nasa_data.get('population', {}).get('population_density_km2', 0)
-            pop_impact = min(20, pop_density / 500)
-            base_score += pop_impact
-            
-            risk_level = self._get_risk_level(base_score)
-            
-            return {
-                "level": risk_level,
-                "score": min(95, int(base_score)),
-                "confidence": 0.75,
-                "metrics": {
-                    "industrial_pollution": pollution_data.get('industrial_pollution_index', 0),
-                    "urban_heat_island": pollution_data.get('urban_heat_island_effect', 0),
-                    "light_pollution": pollution_data.get('light_pollution_index', 0),
-                    "particulate_matter": pollution_data.get('particulate_matter', 0),
-                    "overall_index": overall_pollution
-                },
-                "pollution_hotspots": pollution_data.get('pollution_hotspots', []),
-                "environmental_justice_index": self._calculate_environmental_justice(location_info, base_score),
-                "data_quality": "real" if nasa_data.get('pollution', {}).get('is_real_data', False) else "simulated"
-            }
-        except Exception as e:
-            logger.error(f"Pollution impact error: {e}")
+        pollution_data = nasa_data.get('pollution', {})
+        overall_pollution = _finite(pollution_data, 'overall_pollution_index', 0)
+        pop_density = _finite(nasa_data.get('population', {}), 'population_density_km2', 0)
+        if None in (overall_pollution, pop_density):
             return self._get_pollution_fallback(location_info)
+        
+        base_score = overall_pollution
+        
+        # Location-specific pollution sources
+        location_boost = self._get_location_vulnerability(location_info, "pollution")
+        base_score += location_boost
+        
+        # Population density multiplier
+        pop_impact = min(20, pop_density / 500)
+        base_score += pop_impact
+        
+        risk_level = self._get_risk_level(base_score)
+        
+        return {
+            "level": risk_level,
+            "score": min(95, int(base_score)),
+            "confidence": 0.75,
+            "metrics": {
+                "industrial_pollution": pollution_data.get('industrial_pollution_index', 0),
+                "urban_heat_island": pollution_data.get('urban_heat_island_effect', 0),
+                "light_pollution": pollution_data.get('light_pollution_index', 0),
+                "particulate_matter": pollution_data.get('particulate_matter', 0),
+                "overall_index": overall_pollution
+            },
+            "pollution_hotspots": pollution_data.get('pollution_hotspots', []),
+            "environmental_justice_index": self._calculate_environmental_justice(location_info, base_score),
+            "data_quality": self._dq(pollution_data)
+        }
     
     def calculate_population_impact(self, nasa_data, location_info):
         """Calculate impact of population density on urban systems"""
-        try:
-            population_data = nasa_data.get('population', {})
-            density = population_data.get('population_density_km2', 0)
-            vulnerability = population_data.get('vulnerability_index', 0)
-            
-            # Base score from density
-            if density > 10000:
-                base_score = 75 + min(20, (density - 10000) / 500)
-            elif density > 5000:
-                base_score = 55 + min(20, (density - 5000) / 250)
-            elif density > 2000:
-                base_score = 35 + min(20, (density - 2000) / 150)
-            else:
-                base_score = max(10, density / 200)
-            
-            # Vulnerability adjustment
-            base_score += (vulnerability / 100) * 20
-            
-            # Growth impact
-            growth_impact = min(15, population_data.get('growth_trend', 0) * 3)
-            base_score += growth_impact
-            
-            risk_level = self._get_risk_level(base_score)
-            
-            return {
-                "level": risk_level,
-                "score": min(95, int(base_score)),
-                "confidence": 0.80,
-                "metrics": {
-                    "density_km2": density,
-                    "population_estimate": population_data.get('population_estimate', 0),
-                    "settlement_type": population_data.get('settlement_type', 'unknown'),
-                    "urban_area_km2": population_data.get('urban_footprint_km2', 0),
-                    "growth_rate_percent": population_data.get('growth_trend', 0),
-                    "vulnerability_index": vulnerability
-                },
-                "urban_challenges": self._get_urban_challenges(density, location_info),
-                "planning_recommendations": self._get_planning_recommendations(density, vulnerability),
-                "data_quality": "real" if nasa_data.get('population', {}).get('is_real_data', False) else "simulated"
-            }
-        except Exception as e:
-            logger.error(f"Population impact error: {e}")
+        population_data = nasa_data.get('population', {})
+        density = _finite(population_data, 'population_density_km2', 0)
+        vulnerability = _finite(population_data, 'vulnerability_index', 0)
+        growth_trend = _finite(population_data, 'growth_trend', 0)
+        if None in (density, vulnerability, growth_trend):
             return self._get_population_fallback(location_info)
+        
+        # Base score from density, sparsest (most common) tier first
+        if density <= 2000:
+            base_score = max(10, density / 200)
+        elif density <= 5000:
+            base_score = 35 + min(20, (density - 2000) / 150)
+        elif density <= 10000:
+            base_score = 55 + min(20, (density - 5000) / 250)
+        else:
+            base_score = 75 + min(20, (density - 10000) / 500)
+        
+        # Vulnerability adjustment
+        base_score += (vulnerability / 100) * 20
+        
+        # Growth impact
+        growth_impact = min(15, growth_trend * 3)
+        base_score += growth_impact
+        
+        risk_level = self._get_risk_level(base_score)
+        
+        return {
+            "level": risk_level,
+            "score": min(95, int(base_score)),
+            "confidence": 0.80,
+            "metrics": {
+                "density_km2": density,
+                "population_estimate": population_data.get('population_estimate', 0),
+                "settlement_type": population_data.get('settlement_type', 'unknown'),
+                "urban_area_km2": population_data.get('urban_footprint_km2', 0),
+                "growth_rate_percent": growth_trend,
+                "vulnerability_index": vulnerability
+            },
+            "urban_challenges": self._get_urban_challenges(density, location_info),
+            "planning_recommendations": self._get_planning_recommendations(density, vulnerability),
+            "data_quality": self._dq(population_data)
+        }
+    
+    def calculate_all_risks(self, nasa_data, location_info):
+        """Run every risk calculator once for a location, reusing the result for a repeated snapshot"""
+        key = self._risk_cache_key(nasa_data, location_info)
+        if key is None:
+            return self._score_all_risks(nasa_data, location_info)
+        risks = self._risk_cache.get(key)
+        if risks is None:
+            risks = self._score_all_risks(nasa_data, location_info)
+            # Fallback snapshots are short-lived, so they are not kept
+            if any(risk["data_quality"] == "fallback" for risk in risks.values()):
+                return risks
+            self._risk_cache[key] = risks
+        # Callers store and may mutate the result, so each gets its own copy of the cached entry
+        return copy.deepcopy(risks)
+    
+    def _risk_cache_key(self, nasa_data, location_info):
+        """Key from the input values the calculators read and the current (year, month), or None if unhashable"""
+        values = []
+        for section, fields in _RISK_INPUT_FIELDS:
+            data = nasa_data.get(section, {})
+            values.append(data.get('is_real_data', False))
+            values.extend(data.get(field) for field in fields)
+        profile = location_info.get('risk_profile', {})
+        values.extend(profile.get(factor) for factor in _RISK_PROFILE_FACTORS)
+        values.append(location_info.get('type'))
+        values.append(location_info.get('id'))
+        values.append(location_info.get('demographics', {}).get('vulnerability_index'))
+        key = (tuple(tuple(v) if isinstance(v, list) else v for v in values), self._today())
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+    
+    def _score_all_risks(self, nasa_data, location_info):
+        return {
+            "flood": self.calculate_flood_risk(nasa_data, location_info),
+            "fire": self.calculate_fire_risk(nasa_data, location_info),
+            "drought": self.calculate_drought_risk(nasa_data, location_info),
+            "cyclone": self.calculate_cyclone_risk(nasa_data, location_info),
+            "air_quality": self.calculate_air_quality_risk(nasa_data, location_info),
+            "water_quality": self.calculate_water_quality_risk(nasa_data, location_info),
+            "pollution": self.calculate_pollution_impact(nasa_data, location_info),
+            "population": self.calculate_population_impact(nasa_data, location_info)
+        }
+    
+    # Batch scoring: one array per input field, one entry per location.
+    # Each returns raw (uncapped) scores using the same formulas as the scalar methods.
+    def calculate_flood_scores_batch(self, rainfall_24h, forecast_48h, confidence, flood_factor):
+        """Flood scores for many locations at once"""
+        rain = np.asarray(rainfall_24h, dtype=float)
+        base_score = np.select(
+            [rain > 100, rain > 50, rain > 25],
+            [80 + np.minimum(20, (rain - 100) / 5),
+             55 + np.minimum(25, (rain - 50) / 2),
+             35 + np.minimum(20, rain - 25)],
+            default=np.maximum(10, rain / 2)
+        )
+        forecast_boost = np.minimum(25, np.asarray(forecast_48h, dtype=float) / 4)
+        return base_score + forecast_boost + np.asarray(flood_factor) * 20 + np.asarray(confidence) * 10
+    
+    def calculate_fire_scores_batch(self, fire_count, fire_risk_score, fire_factor):
+        """Fire scores for many locations at once (no vegetation data, as in the scalar default)"""
+        count = np.asarray(fire_count, dtype=float)
+        base_score = np.where(count > 0, 85 + np.minimum(15, count * 3), np.asarray(fire_risk_score, dtype=float))
+        return base_score + self._get_seasonal_fire_boost() + np.asarray(fire_factor) * 20
+    
+    def calculate_drought_scores_batch(self, drought_index, ndvi, drought_factor):
+        """Drought scores for many locations at once (no vegetation health data, as in the scalar default)"""
+        ndvi = np.asarray(ndvi, dtype=float)
+        ndvi_boost = np.select([ndvi < 0.3, ndvi < 0.4, ndvi < 0.5], [30, 20, 10], default=0)
+        return (np.asarray(drought_index, dtype=float) + ndvi_boost + self._get_historical_drought_context()
+                + self._get_seasonal_drought_boost() + np.asarray(drought_factor) * 20)
+    
+    def calculate_air_quality_scores_batch(self, aqi, urban_factor):
+        """Air quality scores for many locations at once"""
+        aqi = np.asarray(aqi, dtype=float)
+        base_score = np.select(
+            [aqi > 150, aqi > 100, aqi > 50],
+            [80 + np.minimum(20, (aqi - 150) / 5),
+             65 + np.minimum(15, (aqi - 100) / 4),
+             40 + np.minimum(25, (aqi - 50) / 2)],
+            default=np.maximum(10, aqi / 5)
+        )
+        return base_score + np.asarray(urban_factor) * 15 + self._get_seasonal_air_quality_impact()
+    
+    def calculate_water_quality_scores_batch(self, pollution_index, coastal_factor, density):
+        """Water quality scores for many locations at once"""
+        density_impact = np.minimum(15, np.asarray(density, dtype=float) / 1000)
+        return (np.asarray(pollution_index, dtype=float) + np.asarray(coastal_factor) * 15
+                + self._get_seasonal_water_quality_impact() + density_impact)
+    
+    def calculate_population_scores_batch(self, density, vulnerability, growth_trend):
+        """Population impact scores for many locations at once"""
+        density = np.asarray(density, dtype=float)
+        base_score = np.select(
+            [density > 10000, density > 5000, density > 2000],
+            [75 + np.minimum(20, (density - 10000) / 500),
+             55 + np.minimum(20, (density - 5000) / 250),
+             35 + np.minimum(20, (density - 2000) / 150)],
+            default=np.maximum(10, density / 200)
+        )
+        growth_impact = np.minimum(15, np.asarray(growth_trend, dtype=float) * 3)
+        return base_score + np.asarray(vulnerability, dtype=float) / 100 * 20 + growth_impact
+    
+    def get_risk_levels_batch(self, scores):
+        """Risk level labels for an array of raw scores"""
+        return self._RISK_LEVEL_LABELS[np.searchsorted(self._RISK_LEVEL_THRESHOLDS, scores, side="right")]
     
     # Helper methods
-    def _get_risk_level(self, score):
-        if score >= 80:
-            return "CRITICAL"
-        elif score >= 60:
-            return "HIGH"
-        elif score >= 40:
-            return "MEDIUM"
-        elif score >= 20:
-            return "LOW"
-        else:
-            return "VERY_LOW"
+    @staticmethod
+    def _dq(source_data):
+        """Data quality label for one nasa_data section"""
+        return "real" if source_data.get('is_real_data', False) else "simulated"
     
-    def _get_location_vulnerability(self, location_info, risk_type):
+    @staticmethod
+    def _get_risk_level(score):
+        return _RISK_LEVEL_BY_SCORE[min(100, max(0, int(score)))]
+    
+    @staticmethod
+    def _get_location_vulnerability(location_info, risk_type):
         """Get location-specific vulnerability for different risk types"""
-        risk_factors = location_info.get('risk_profile', {})
-        
-        if risk_type == "flood":
-            return risk_factors.get('flood', 0.5) * 20
-        elif risk_type == "fire":
-            return risk_factors.get('fire', 0.5) * 20
-        elif risk_type == "drought":
-            return risk_factors.get('drought', 0.5) * 20
-        elif risk_type == "cyclone":
-            return risk_factors.get('coastal', 0.3) * 15
-        elif risk_type == "air_quality":
-            return risk_factors.get('urban', 0.5) * 15
-        elif risk_type == "water_quality":
-            return risk_factors.get('coastal', 0.3) * 15
-        elif risk_type == "pollution":
-            return risk_factors.get('industrial', 0.5) * 20
-        else:
+        vulnerability = _LOCATION_VULNERABILITY.get(risk_type)
+        if vulnerability is None:
             return 10
+        factor, default, weight = vulnerability
+        return location_info.get('risk_profile', {}).get(factor, default) * weight
+    
+    @classmethod
+    def _today(cls):
+        """Get (year, month) for the current scoring pass, refreshed at most once a second"""
+        tick = time.monotonic()
+        if cls._today_cache is None or tick - cls._today_cache[0] >= 1.0:
+            now = datetime.utcnow()
+            cls._today_cache = (tick, now.year, now.month)
+        return cls._today_cache[1], cls._today_cache[2]
     
     def _get_seasonal_fire_boost(self):
-        current_month = datetime.utcnow().month
-        if current_month in [8, 9, 10, 11]:
-            return 20
-        elif current_month in [7, 12]:
-            return 10
-        return 0
+        return self._FIRE_SEASON_BOOST[self._today()[1]]
     
     def _get_seasonal_drought_boost(self):
-        current_month = datetime.utcnow().month
-        if current_month in [5, 6, 7, 8, 9]:
-            return 15
-        return 0
+        return self._DROUGHT_SEASON_BOOST[self._today()[1]]
     
     def _get_seasonal_air_quality_impact(self):
-        current_month = datetime.utcnow().month
-        if current_month in [6, 7, 8, 9]:
-            return 15
-        return 0
+        return self._AIR_QUALITY_SEASON_IMPACT[self._today()[1]]
     
     def _get_seasonal_water_quality_impact(self):
-        current_month = datetime.utcnow().month
-        if current_month in [1, 2, 3, 4]:
-            return 12
-        return 0
+        return self._WATER_QUALITY_SEASON_IMPACT[self._today()[1]]
     
-    def _get_flood_type(self, rainfall, location_info):
+    @staticmethod
+    def _get_flood_type(rainfall, location_info):
         if rainfall > 100:
             return "major_flood"
         elif rainfall > 60:
@@ -474,182 +760,64 @@ class EnhancedRiskEngine:
         else:
             return "localized_flooding"
     
-    def _get_impact_areas(self, location_info, score):
-        location_type = location_info.get('type', 'MUNICIPALITY')
-        name = location_info.get('name', 'Unknown')
-        
-        if location_type == "MUNICIPALITY":
-            if "VIANA" in name.upper():
-                return ["Industrial Zone", "Transport Corridors"]
-            elif "INGOMBOTA" in name.upper():
-                return ["City Center", "Commercial Areas"]
-            elif "MUSSULO" in name.upper():
-                return ["Coastal Areas", "Fishing Zones"]
-        
-        return ["Urban Area", "Residential Zones"]
+    def _get_impact_areas(self, location_info):
+        if location_info.get('type', 'MUNICIPALITY') == "MUNICIPALITY":
+            return self._IMPACT_AREAS.get(location_info.get('id'), self._IMPACT_AREAS_DEFAULT)
+        return self._IMPACT_AREAS_DEFAULT
     
     def _get_drought_category(self, score):
-        if score > 75:
-            return "S3_Severe_Drought"
-        elif score > 55:
-            return "S2_Moderate_Drought"
-        elif score > 35:
-            return "S1_Mild_Drought"
-        else:
-            return "S0_No_Drought"
-    
-    def _get_health_impact_level(self, aqi):
-        if aqi > 150:
-            return "Serious health effects"
-        elif aqi > 100:
-            return "Unhealthy for sensitive groups"
-        elif aqi > 50:
-            return "Moderate health concern"
-        else:
-            return "Minimal health impact"
+        return self._DROUGHT_CATEGORIES[bisect_left(self._DROUGHT_CATEGORY_THRESHOLDS, score)]
     
-    def _get_vulnerable_groups(self, aqi):
-        if aqi > 100:
-            return ["Children", "Elderly", "Respiratory conditions", "Heart conditions"]
-        elif aqi > 50:
-            return ["Children", "Elderly", "Respiratory conditions"]
-        else:
-            return ["None specific"]
+    @staticmethod
+    def _get_aqi_band(aqi):
+        """AQI band index: 0 (<= 50), 1 (<= 100), 2 (<= 150), 3 (> 150)"""
+        return bisect_left(_AQI_BAND_THRESHOLDS, aqi)
     
     def _get_water_impact_areas(self, location_info):
-        name = location_info.get('name', '')
-        if "MUSSULO" in name.upper():
-            return ["Coastal Waters", "Fishing Areas"]
-        elif "INGOMBOTA" in name.upper():
-            return ["Urban Rivers", "Drainage Systems"]
-        elif "VIANA" in name.upper():
-            return ["Industrial Canals", "Wastewater Outflows"]
-        else:
-            return ["Water Bodies", "Drainage Systems"]
+        return self._WATER_IMPACT_AREAS.get(location_info.get('id'), self._WATER_IMPACT_AREAS_DEFAULT)
     
     def _get_water_health_implications(self, pollution_index):
-        if pollution_index > 70:
-            return "High risk of waterborne diseases"
-        elif pollution_index > 50:
-            return "Moderate health risk, avoid ingestion"
-        elif pollution_index > 30:
-            return "Low risk, basic treatment recommended"
-        else:
-            return "Minimal health risk"
+        return self._WATER_HEALTH_IMPLICATIONS[bisect_left(self._WATER_HEALTH_THRESHOLDS, pollution_index)]
     
-    def _calculate_environmental_justice(self, location_info, pollution_score):
+    @staticmethod
+    def _calculate_environmental_justice(location_info, pollution_score):
         vulnerability = location_info.get('demographics', {}).get('vulnerability_index', 50)
         return min(100, (vulnerability + pollution_score) / 2)
     
     def _get_urban_challenges(self, density, location_info):
-        challenges = []
-        if density > 8000:
-            challenges.extend(["Overcrowding", "Sanitation issues", "Traffic congestion"])
-        if density > 5000:
-            challenges.extend(["Housing pressure", "Service delivery strain"])
-        if location_info.get('type') == 'MUNICIPALITY':
-            challenges.extend(["Urban planning needs", "Infrastructure maintenance"])
-        return challenges
+        tier = bisect_left(_DENSITY_TIER_THRESHOLDS, density)
+        return self._URBAN_CHALLENGES[tier][location_info.get('type') == 'MUNICIPALITY']
     
     def _get_planning_recommendations(self, density, vulnerability):
-        recommendations = []
-        if density > 8000:
-            recommendations.extend(["Upgrade public transport", "Improve green spaces"])
-        if vulnerability > 70:
-            recommendations.extend(["Target social housing", "Enhance emergency services"])
-        if density > 5000:
-            recommendations.extend(["Mixed-use development", "Infrastructure investment"])
-        return recommendations if recommendations else ["Maintain current planning strategies"]
+        tier = bisect_left(_DENSITY_TIER_THRESHOLDS, density)
+        return self._PLANNING_RECOMMENDATIONS[tier][vulnerability > 70]
     
     def _get_historical_drought_context(self):
-        current_year = datetime.utcnow().year
-        recent_droughts = [d for d in self.historical_data['drought_periods'] 
-                          if d['year'] >= current_year - 2]
-        if recent_droughts:
-            return 10
-        return 0
+        if self._latest_drought_year is None:
+            return 0
+        return 10 if self._latest_drought_year >= self._today()[0] - 2 else 0
     
-    # Fallback methods
+    # Fallback methods (deep copies of the class-level templates, so callers cannot change them)
     def _get_flood_fallback(self, location_info):
-        return {
-            "level": "LOW",
-            "score": 20,
-            "confidence": 0.5,
-            "factors": {"fallback": True},
-            "prediction_horizon_hours": 24,
-            "flood_type": "unknown",
-            "expected_impact_areas": ["General Area"],
-            "data_quality": "fallback"
-        }
+        return copy.deepcopy(self._FALLBACK_FLOOD)
     
     def _get_fire_fallback(self, location_info):
-        return {
-            "level": "LOW", 
-            "score": 15,
-            "confidence": 0.5,
-            "details": {"fallback": True},
-            "data_quality": "fallback"
-        }
+        return copy.deepcopy(self._FALLBACK_FIRE)
     
     def _get_drought_fallback(self, location_info):
-        return {
-            "level": "LOW",
-            "score": 25,
-            "confidence": 0.5,
-            "indices": {"fallback": True},
-            "drought_category": "S0_No_Drought",
-            "data_quality": "fallback"
-        }
+        return copy.deepcopy(self._FALLBACK_DROUGHT)
     
     def _get_cyclone_fallback(self, location_info):
-        return {
-            "level": "LOW",
-            "score": 10,
-            "confidence": 0.5,
-            "details": {"fallback": True},
-            "data_quality": "fallback"
-        }
+        return copy.deepcopy(self._FALLBACK_CYCLONE)
     
     def _get_air_quality_fallback(self, location_info):
-        return {
-            "level": "MEDIUM",
-            "score": 45,
-            "confidence": 0.5,
-            "metrics": {"fallback": True},
-            "health_advisory": "Moderate - Sensitive groups should take care",
-            "vulnerable_groups": ["Children", "Elderly"],
-            "data_quality": "fallback"
-        }
+        return copy.deepcopy(self._FALLBACK_AIR_QUALITY)
     
     def _get_water_quality_fallback(self, location_info):
-        return {
-            "level": "LOW",
-            "score": 35,
-            "confidence": 0.5,
-            "metrics": {"fallback": True},
-            "impact_areas": ["General Water Bodies"],
-            "health_implications": "Low risk, basic treatment recommended",
-            "data_quality": "fallback"
-        }
+        return copy.deepcopy(self._FALLBACK_WATER_QUALITY)
     
     def _get_pollution_fallback(self, location_info):
-        return {
-            "level": "MEDIUM", 
-            "score": 50,
-            "confidence": 0.5,
-            "metrics": {"fallback": True},
-            "pollution_hotspots": ["General Area"],
-            "environmental_justice_index": 60,
-            "data_quality": "fallback"
-        }
+        return copy.deepcopy(self._FALLBACK_POLLUTION)
     
     def _get_population_fallback(self, location_info):
-        return {
-            "level": "MEDIUM",
-            "score": 55,
-            "confidence": 0.5,
-            "metrics": {"fallback": True},
-            "urban_challenges": ["General urban pressures"],
-            "planning_recommendations": ["Infrastructure monitoring"],
-            "data_quality": "fallback"
-        }
\ No newline at end of file
+        return copy.deepcopy(self._FALLBACK_POPULATION)
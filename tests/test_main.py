@@ -0,0 +1,120 @@
+import asyncio
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.nasa_data_service import RealNASADataService
+
+
+@pytest.fixture
+def client(monkeypatch):
+    async def no_refresh(*args):
+        pass
+    monkeypatch.setattr(main, "refresh_location_data", no_refresh)
+    main.fallback_response_cache.clear()
+    return TestClient(main.app)
+
+
+def test_fallback_response_is_fresh_and_not_public():
+    main.fallback_response_cache.clear()
+    first = asyncio.run(main.build_fallback_response("LUANDA", "VIANA"))
+    second = asyncio.run(main.build_fallback_response("LUANDA", "VIANA"))
+    
+    assert first is not second
+    assert first.body == second.body
+    assert first.media_type == "application/json"
+    assert first.headers["cache-control"] == "no-store"
+    
+    payload = orjson.loads(first.body)
+    assert payload["dashboard"]["fallback_mode"] is True
+    assert payload["dashboard"]["location"]["id"] == "VIANA"
+
+
+def test_municipality_endpoint_serves_fallback_on_error(client, monkeypatch):
+    async def failing_fetch(*args):
+        raise RuntimeError("source down")
+    monkeypatch.setattr(main, "get_nasa_data_for_location", failing_fetch)
+    
+    response = client.get("/api/LUANDA/VIANA")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["cache-control"] == "no-store"
+    assert response.json()["dashboard"]["data_freshness"] == "FALLBACK_MODE"
+
+
+def test_shared_session_closed_on_shutdown():
+    with TestClient(main.app) as client:
+        assert client.get("/").status_code == 200
+        # The startup refresh opens the shared session
+        session = RealNASADataService._shared_session
+        assert session is not None and not session.closed
+    
+    assert session.closed
+    assert RealNASADataService._shared_session is None
+
+
+def _scalar_risks(row, risk_factors):
+    """Score one bulk indicator row with the scalar risk methods"""
+    nasa_data = {
+        "gpm": {field: row[field] for field in ("rainfall_24h_mm", "forecast_48h_mm", "confidence")},
+        "viirs": {field: row[field] for field in ("fire_count", "fire_risk_score")},
+        "air_quality": {"air_quality_index": row["air_quality_index"]},
+        "water_quality": {"pollution_index": row["pollution_index"]},
+        "population": {field: row[field] for field in
+                       ("population_density_km2", "vulnerability_index", "growth_trend")}
+    }
+    location_info = {"risk_profile": risk_factors}
+    engine = main.risk_engine
+    return {
+        "flood": engine.calculate_flood_risk(nasa_data, location_info),
+        "fire": engine.calculate_fire_risk(nasa_data, location_info),
+        "drought": engine.calculate_drought_risk(nasa_data, location_info),
+        "air_quality": engine.calculate_air_quality_risk(nasa_data, location_info),
+        "water_quality": engine.calculate_water_quality_risk(nasa_data, location_info),
+        "population": engine.calculate_population_impact(nasa_data, location_info)
+    }
+
+
+def test_score_bulk_risks_matches_scalar_scores():
+    indicators = asyncio.run(main.RealNASADataService().get_indicators_bulk(list(main.geo_data.municipalities)))
+    risks = main.score_bulk_risks(indicators)
+    assert list(risks) == list(indicators)
+    
+    for mun_id, mun_risks in risks.items():
+        scalar = _scalar_risks(indicators[mun_id], main.geo_data.municipalities[mun_id].risk_factors)
+        assert set(mun_risks) == set(scalar)
+        for risk_type, risk in mun_risks.items():
+            assert risk == {"level": scalar[risk_type]["level"], "score": scalar[risk_type]["score"]}, risk_type
+
+
+def test_score_bulk_risks_empty():
+    assert main.score_bulk_risks({}) == {}
+
+
+def test_bulk_endpoint(client):
+    response = client.post("/api/indicators", json={"municipalities": ["viana", "CAZENGA"]})
+    assert response.status_code == 200
+    body = response.json()
+    assert list(body["indicators"]) == ["VIANA", "CAZENGA"]
+    assert list(body["risks"]) == ["VIANA", "CAZENGA"]
+    assert body["total_locations"] == 2
+    for mun_risks in body["risks"].values():
+        for risk in mun_risks.values():
+            assert risk["level"] in main.RISK_LEVELS
+            assert 0 <= risk["score"] <= 98
+
+
+def test_bulk_endpoint_rejects_unknown_ids(client):
+    response = client.post("/api/indicators", json={"municipalities": ["VIANA", "NOPE"]})
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Municipalities not found: NOPE"
+
+
+def test_bulk_endpoint_empty_list_means_all(client):
+    response = client.post("/api/indicators", json={"municipalities": []})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total_locations"] == len(main.geo_data.municipalities)
+    assert set(body["risks"]) == set(main.geo_data.municipalities)
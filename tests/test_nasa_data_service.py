@@ -0,0 +1,85 @@
+import asyncio
+import copy
+
+import pytest
+
+from app.nasa_data_service import RealNASADataService
+
+
+def test_rainy_season_fire_adjustment():
+    service = RealNASADataService()
+    for month in service.seasonal_patterns["rainy_season"]["months"]:
+        assert service._get_seasonal_fire_adjustment(month) == pytest.approx(0.7)
+
+
+def test_dry_season_fire_adjustment():
+    service = RealNASADataService()
+    for month in service.seasonal_patterns["dry_season"]["months"]:
+        assert service._get_seasonal_fire_adjustment(month) == pytest.approx(1.4)
+
+
+def test_cached_response_is_not_shared_with_callers():
+    service = RealNASADataService()
+    service.cache.clear()
+    first = asyncio.run(service.get_real_viirs_fires("VIANA"))
+    assert first["is_real_data"]
+    snapshot = copy.deepcopy(first)
+    
+    first["active_fires"].append({"latitude": 0.0, "longitude": 0.0})
+    first["fire_count"] = -1
+    
+    assert asyncio.run(service.get_real_viirs_fires("VIANA")) == snapshot
+
+
+# Bulk field -> get_all_indicators section holding the same field
+BULK_SECTIONS = {
+    "rainfall_24h_mm": "gpm",
+    "forecast_48h_mm": "gpm",
+    "confidence": "gpm",
+    "intensity": "gpm",
+    "fire_count": "viirs",
+    "fire_risk_score": "viirs",
+    "pm25_estimate": "air_quality",
+    "air_quality_index": "air_quality",
+    "health_advisory": "air_quality",
+    "primary_pollutant": "air_quality",
+    "pollution_index": "water_quality",
+    "population_density_km2": "population",
+    "vulnerability_index": "population",
+    "growth_trend": "population"
+}
+# Fields drawn at random on each call; the rest are fixed for a location and month
+RANDOM_BULK_FIELDS = {"rainfall_24h_mm", "forecast_48h_mm", "intensity", "fire_count"}
+
+
+def test_bulk_indicators_match_per_location_indicators():
+    service = RealNASADataService()
+    location_ids = ["VIANA", "CAZENGA", "MUSSULO"]
+    bulk = asyncio.run(service.get_indicators_bulk(location_ids))
+    assert list(bulk) == location_ids
+    
+    for location_id in location_ids:
+        row = bulk[location_id]
+        single = asyncio.run(service.get_all_indicators(location_id))
+        assert row["is_real_data"]
+        assert set(row) == set(BULK_SECTIONS) | {"data_source", "last_updated", "is_real_data"}
+        for field, section in BULK_SECTIONS.items():
+            expected = single[section][field]
+            assert type(row[field]) is type(expected), field
+            if field not in RANDOM_BULK_FIELDS:
+                assert row[field] == expected, field
+        
+        assert row["rainfall_24h_mm"] >= 0 and row["forecast_48h_mm"] >= 0 and row["fire_count"] >= 0
+        assert row["intensity"] in service._RAINFALL_INTENSITIES
+
+
+def test_bulk_indicators_skip_unknown_ids():
+    service = RealNASADataService()
+    bulk = asyncio.run(service.get_indicators_bulk(["VIANA", "NOPE"]))
+    assert list(bulk) == ["VIANA"]
+
+
+def test_bulk_indicators_empty_list():
+    service = RealNASADataService()
+    assert asyncio.run(service.get_indicators_bulk([])) == {}
+    assert asyncio.run(service.get_indicators_bulk(["NOPE"])) == {}
@@ -0,0 +1,301 @@
+import copy
+
+import numpy as np
+import pytest
+
+from app.risk_engine import EnhancedRiskEngine
+
+
+def _snapshot():
+    nasa_data = {
+        "gpm": {"rainfall_24h_mm": 42.0, "forecast_48h_mm": 30.0, "confidence": 0.8, "is_real_data": True},
+        "viirs": {"fire_count": 0, "fire_risk_score": 35.0, "is_real_data": True},
+        "modis": {"ndvi": 0.45, "drought_index": 20, "is_real_data": True},
+        "cyclone": {"active_systems": 0, "is_real_data": True},
+        "air_quality": {"air_quality_index": 85, "pm25_estimate": 28.5, "is_real_data": True},
+        "water_quality": {"pollution_index": 40.0, "is_real_data": True},
+        "pollution": {"overall_pollution_index": 55.0, "is_real_data": True},
+        "population": {"population_density_km2": 6500, "vulnerability_index": 60, "growth_trend": 3.5,
+                       "is_real_data": True}
+    }
+    location_info = {
+        "id": "LUANDA",
+        "type": "MUNICIPALITY",
+        "risk_profile": {"flood": 0.8, "fire": 0.5, "coastal": 0.9, "urban": 0.9, "industrial": 0.7},
+        "demographics": {"vulnerability_index": 60}
+    }
+    return nasa_data, location_info
+
+
+def _count_scoring(monkeypatch):
+    """Count calls to the uncached scoring pass"""
+    calls = []
+    score_all_risks = EnhancedRiskEngine._score_all_risks
+    
+    def counting(self, nasa_data, location_info):
+        calls.append(1)
+        return score_all_risks(self, nasa_data, location_info)
+    monkeypatch.setattr(EnhancedRiskEngine, "_score_all_risks", counting)
+    return calls
+
+
+def test_calculate_all_risks_reuses_cached_result(monkeypatch):
+    calls = _count_scoring(monkeypatch)
+    engine = EnhancedRiskEngine()
+    nasa_data, location_info = _snapshot()
+    first = engine.calculate_all_risks(nasa_data, location_info)
+    
+    # An equal snapshot built separately hits the cache and gets its own copy
+    nasa_data, location_info = _snapshot()
+    again = engine.calculate_all_risks(nasa_data, location_info)
+    assert len(calls) == 1
+    assert again == first and again is not first
+    
+    # A changed scoring input misses it
+    nasa_data["gpm"]["rainfall_24h_mm"] = 120.0
+    second = engine.calculate_all_risks(nasa_data, location_info)
+    assert len(calls) == 2
+    assert second["flood"]["score"] > first["flood"]["score"]
+
+
+def test_cached_risks_are_not_shared_with_callers():
+    engine = EnhancedRiskEngine()
+    nasa_data, location_info = _snapshot()
+    first = engine.calculate_all_risks(nasa_data, location_info)
+    expected = copy.deepcopy(first)
+    
+    first["flood"]["score"] = -1
+    first["flood"]["factors"]["current_rainfall"] = -1
+    first["flood"]["expected_impact_areas"] = []
+    
+    assert engine.calculate_all_risks(nasa_data, location_info) == expected
+
+
+def test_calculate_all_risks_key_ignores_unread_fields(monkeypatch):
+    calls = _count_scoring(monkeypatch)
+    engine = EnhancedRiskEngine()
+    nasa_data, location_info = _snapshot()
+    first = engine.calculate_all_risks(nasa_data, location_info)
+    
+    # NumPy scalars and datetimes in unread fields do not break the key
+    nasa_data["gpm"]["rainfall_24h_mm"] = np.float64(42.0)
+    nasa_data["gpm"]["retrieved_at"] = np.datetime64("2024-01-01")
+    nasa_data["viirs"]["bbox"] = [13.1, -8.9, 13.3, -8.7]
+    assert engine.calculate_all_risks(nasa_data, location_info) == first
+    assert len(calls) == 1
+
+
+def test_calculate_all_risks_does_not_cache_fallback(monkeypatch):
+    calls = _count_scoring(monkeypatch)
+    engine = EnhancedRiskEngine()
+    nasa_data, location_info = _snapshot()
+    del nasa_data["gpm"]["rainfall_24h_mm"]
+    
+    first = engine.calculate_all_risks(nasa_data, location_info)
+    assert first["flood"]["data_quality"] == "fallback"
+    assert engine.calculate_all_risks(nasa_data, location_info) == first
+    assert len(calls) == 2
+    assert len(engine._risk_cache) == 0
+
+
+class _ReadRecorder(dict):
+    """Dict that records the path of every key read through get() or []"""
+    
+    def __init__(self, data, path, reads):
+        super().__init__(data)
+        self._path = path
+        self._reads = reads
+    
+    def _wrap(self, key, value):
+        self._reads.add(self._path + (key,))
+        return _ReadRecorder(value, self._path + (key,), self._reads) if isinstance(value, dict) else value
+    
+    def get(self, key, default=None):
+        return self._wrap(key, super().get(key, default))
+    
+    def __getitem__(self, key):
+        return self._wrap(key, super().__getitem__(key))
+
+
+def _recorded_reads(read, nasa_data, location_info):
+    reads = set()
+    read(_ReadRecorder(nasa_data, ("nasa_data",), reads), _ReadRecorder(location_info, ("location_info",), reads))
+    return reads
+
+
+def test_risk_cache_key_covers_every_calculator_input():
+    engine = EnhancedRiskEngine()
+    key_reads = _recorded_reads(engine._risk_cache_key, *_snapshot())
+    
+    # Take the branches that read extra fields: active fires, poor vegetation, an active cyclone
+    nasa_data, location_info = _snapshot()
+    nasa_data["viirs"]["fire_count"] = 3
+    nasa_data["modis"]["vegetation_health"] = "poor"
+    nasa_data["cyclone"]["active_systems"] = 1
+    for snapshot in (_snapshot(), (nasa_data, location_info)):
+        calculator_reads = _recorded_reads(engine._score_all_risks, *snapshot)
+        assert calculator_reads <= key_reads, "add these to _RISK_INPUT_FIELDS: %s" % sorted(calculator_reads - key_reads)
+
+
+def test_fallbacks_are_not_shared_with_callers():
+    engine = EnhancedRiskEngine()
+    nasa_data, location_info = _snapshot()
+    del nasa_data["gpm"]["rainfall_24h_mm"]
+    del nasa_data["viirs"]["fire_count"]
+    
+    first = engine.calculate_all_risks(nasa_data, location_info)
+    expected = copy.deepcopy(first)
+    first["flood"]["factors"]["fallback"] = False
+    first["fire"]["details"]["reason"] = "changed"
+    first["flood"]["score"] = -1
+    
+    assert engine.calculate_all_risks(nasa_data, location_info) == expected
+    assert engine._get_flood_fallback(location_info)["factors"] == {"fallback": True}
+
+
+# (risk type, nasa_data section, numeric field) for every numeric input a calculator scores
+NUMERIC_INPUTS = [
+    ("flood", "gpm", "rainfall_24h_mm"),
+    ("flood", "gpm", "forecast_48h_mm"),
+    ("flood", "gpm", "confidence"),
+    ("fire", "viirs", "fire_count"),
+    ("fire", "viirs", "fire_risk_score"),
+    ("fire", "modis", "ndvi"),
+    ("drought", "modis", "ndvi"),
+    ("drought", "modis", "drought_index"),
+    ("cyclone", "cyclone", "active_systems"),
+    ("air_quality", "air_quality", "air_quality_index"),
+    ("water_quality", "water_quality", "pollution_index"),
+    ("water_quality", "population", "population_density_km2"),
+    ("pollution", "pollution", "overall_pollution_index"),
+    ("pollution", "population", "population_density_km2"),
+    ("population", "population", "population_density_km2"),
+    ("population", "population", "vulnerability_index"),
+    ("population", "population", "growth_trend")
+]
+
+
+@pytest.mark.parametrize("bad_value", [None, float("nan"), float("inf"), "12"], ids=["none", "nan", "inf", "string"])
+@pytest.mark.parametrize("risk_type, section, field", NUMERIC_INPUTS)
+def test_invalid_numeric_input_falls_back(risk_type, section, field, bad_value):
+    engine = EnhancedRiskEngine()
+    nasa_data, location_info = _snapshot()
+    nasa_data[section][field] = bad_value
+    
+    risks = engine.calculate_all_risks(nasa_data, location_info)
+    assert risks[risk_type]["data_quality"] == "fallback"
+
+
+def test_drought_context_without_history():
+    engine = EnhancedRiskEngine()
+    assert engine._latest_drought_year is None
+    assert engine._get_historical_drought_context() == 0
+    
+    nasa_data, location_info = _snapshot()
+    assert engine.calculate_drought_risk(nasa_data, location_info)["data_quality"] == "real"
+
+
+def test_drought_context_with_recent_drought():
+    engine = EnhancedRiskEngine()
+    engine._latest_drought_year = engine._today()[0] - 1
+    assert engine._get_historical_drought_context() == 10
+
+
+# Parity between the scalar calculate_* methods and their *_scores_batch counterparts.
+# Batch scores are capped and labelled the way score_bulk_risks does it.
+BAND_EDGES = {20.0, 40.0, 60.0, 80.0}
+
+
+@pytest.fixture(params=[1, 7, 9], ids=["january", "july", "september"])
+def engine(request, monkeypatch):
+    # Pin the month so the seasonal boosts are known (January: water, July/September: fire and air)
+    monkeypatch.setattr(EnhancedRiskEngine, "_today", classmethod(lambda cls: (2024, request.param)))
+    return EnhancedRiskEngine()
+
+
+def _grid(*axes):
+    return [np.ravel(axis) for axis in np.meshgrid(*axes, indexing="ij")]
+
+
+def _rows(*columns):
+    """Grid rows as plain Python numbers, as the scalar path receives them"""
+    return zip(*(column.tolist() for column in columns))
+
+
+def _assert_parity(engine, scalar_results, raw, cap, edges=BAND_EDGES):
+    assert np.minimum(cap, raw.astype(int)).tolist() == [result["score"] for result in scalar_results]
+    assert engine.get_risk_levels_batch(raw).tolist() == [result["level"] for result in scalar_results]
+    # The grid must reach the level edges exactly and go past the score cap
+    assert edges <= set(raw.tolist())
+    assert raw.max() > cap
+
+
+def test_flood_batch_parity(engine):
+    rain, forecast, factor, confidence = _grid(np.arange(0, 300.5, 0.5), [0, 40, 120], [0, 0.5, 1], [0, 0.7])
+    scalar = [
+        engine.calculate_flood_risk(
+            {"gpm": {"rainfall_24h_mm": r, "forecast_48h_mm": f, "confidence": c}},
+            {"risk_profile": {"flood": v}})
+        for r, f, v, c in _rows(rain, forecast, factor, confidence)
+    ]
+    raw = engine.calculate_flood_scores_batch(rain, forecast, confidence, factor)
+    _assert_parity(engine, scalar, raw, 98)
+
+
+def test_fire_batch_parity(engine):
+    count, risk_score, factor = _grid([0, 1, 2, 5], np.arange(0, 100.5, 0.5), [0, 0.5, 1])
+    scalar = [
+        engine.calculate_fire_risk(
+            {"viirs": {"fire_count": n, "fire_risk_score": s}},
+            {"risk_profile": {"fire": v}})
+        for n, s, v in _rows(count, risk_score, factor)
+    ]
+    raw = engine.calculate_fire_scores_batch(count, risk_score, factor)
+    _assert_parity(engine, scalar, raw, 95)
+
+
+def test_drought_batch_parity(engine):
+    drought_index, ndvi, factor = _grid(np.arange(0, 100.5, 0.5), [0.2, 0.3, 0.35, 0.4, 0.45, 0.5, 0.8], [0, 0.5, 1])
+    scalar = [
+        engine.calculate_drought_risk({"modis": {"drought_index": i, "ndvi": n}}, {"risk_profile": {"drought": v}})
+        for i, n, v in _rows(drought_index, ndvi, factor)
+    ]
+    raw = engine.calculate_drought_scores_batch(drought_index, ndvi, factor)
+    _assert_parity(engine, scalar, raw, 95)
+
+
+def test_air_quality_batch_parity(engine):
+    # Include the AQI breakpoints and the values just above them
+    aqi_values = np.union1d(np.arange(0, 400.5, 0.5), [50, 50.1, 100, 100.1, 150, 150.1])
+    aqi, factor = _grid(aqi_values, [0, 0.5, 1])
+    scalar = [
+        engine.calculate_air_quality_risk({"air_quality": {"air_quality_index": a}}, {"risk_profile": {"urban": v}})
+        for a, v in _rows(aqi, factor)
+    ]
+    raw = engine.calculate_air_quality_scores_batch(aqi, factor)
+    # Up to AQI 50 the base score is flat at 10 and just above it starts past 40,
+    # so raw scores of exactly 20 and 40 depend on the month and are not required
+    _assert_parity(engine, scalar, raw, 95, BAND_EDGES - {20.0, 40.0})
+
+
+def test_water_quality_batch_parity(engine):
+    pollution, factor, density = _grid(np.arange(0, 100.5, 0.5), [0, 0.3, 1], [0, 5000, 20000])
+    scalar = [
+        engine.calculate_water_quality_risk(
+            {"water_quality": {"pollution_index": p}, "population": {"population_density_km2": d}},
+            {"risk_profile": {"coastal": v}})
+        for p, v, d in _rows(pollution, factor, density)
+    ]
+    raw = engine.calculate_water_quality_scores_batch(pollution, factor, density)
+    _assert_parity(engine, scalar, raw, 95)
+
+
+def test_population_batch_parity(engine):
+    density, vulnerability, growth = _grid(np.arange(0, 30025, 25), [0, 50, 100], [0, 1, 5])
+    scalar = [
+        engine.calculate_population_impact(
+            {"population": {"population_density_km2": d, "vulnerability_index": v, "growth_trend": g}}, {})
+        for d, v, g in _rows(density, vulnerability, growth)
+    ]
+    raw = engine.calculate_population_scores_batch(density, vulnerability, growth)
+    _assert_parity(engine, scalar, raw, 95)